@@ -19,13 +19,45 @@ import sys
 import subprocess
 import tempfile
 import logging
+import json
+import hashlib
+import asyncio
+import functools
+import collections
 import requests
 import time
 import shutil
 import zipfile
 import tarfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Streaming buffer size for downloads (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Buffer size for staging binaries into the install directory (1 MiB)
+COPY_BUFFER_SIZE = 1 << 20
+
+
+@functools.lru_cache(maxsize=256)
+def _win_to_cygwin(path_str):
+    """Convert a Windows path string to Cygwin format (memoized)"""
+    path = Path(path_str)
+    # resolve() hits the filesystem; only needed for relative inputs
+    if not path.is_absolute():
+        path = path.resolve()
+    path_str = str(path).replace('\\', '/')
+    
+    # Convert C: to /cygdrive/c
+    if path_str[1:3] == ':/':
+        drive = path_str[0].lower()
+        path_str = f"/cygdrive/{drive}{path_str[2:]}"
+    
+    return path_str
+
 
 class AdvancedRarFSInstaller:
     def __init__(self):
@@ -33,6 +65,8 @@ class AdvancedRarFSInstaller:
         self.temp_dir = Path(tempfile.mkdtemp())
         self.cygwin_root = Path("C:/cygwin64")
         self.install_dir = Path("C:/Program Files/rar2fs")
+        self._is_admin = self._detect_admin()
+        self.cache_dir = Path(os.environ.get('LOCALAPPDATA', tempfile.gettempdir())) / 'rar2fs-installer' / 'cache'
         
         # Download URLs
         self.downloads = {
@@ -43,6 +77,30 @@ class AdvancedRarFSInstaller:
             'rar2fs_source': 'https://github.com/hasse69/rar2fs/archive/refs/heads/master.zip'
         }
         
+        # Fallback DLL set used when the import table cannot be inspected
+        self.default_dlls = [
+            "cygwin1.dll",
+            "cygfuse-2.dll",
+            "cyggcc_s-seh-1.dll",
+            "cygstdc++-6.dll"
+        ]
+        self.dll_closure_cache = self.cache_dir / 'rar2fs_dll_closure.json'
+        
+        # Parallel job count for make
+        self.make_jobs = os.cpu_count() or 4
+        
+        # Known-good SHA-256 digests, keyed by download name; artifacts listed here
+        # are re-downloaded and rejected if their content differs
+        self.expected_sha256 = {}
+        # Publisher that must have signed a download; checked independently of any digest
+        self.authenticode_signers = {'winfsp': 'Navimatics'}
+        # Secondary check: versioned downloads without a digest above are pinned on first
+        # download. The pins share the user-writable cache, so they only catch later changes.
+        self.pinned_sha256_path = self.cache_dir / 'pinned_sha256.json'
+        
+        # Branch snapshots and unversioned URLs change in place, so they are always revalidated
+        self.mutable_downloads = {'rar2fs_source', 'cygwin_setup'}
+        
         # Required Cygwin packages
         self.cygwin_packages = [
             'automake',
@@ -55,7 +113,6 @@ class AdvancedRarFSInstaller:
             'wget',
             'tar',
             'gzip',
-            'unzip',  # Required for extracting rar2fs source
             'gettext-devel',  # Required for autopoint (used by autoreconf)
             'pkg-config',
             'libtool',
@@ -64,6 +121,19 @@ class AdvancedRarFSInstaller:
             'cygwin-devel'
         ]
         
+        # Shared HTTP session so downloads reuse pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Paths of artifacts fetched by prefetch_all(), keyed by download name
+        self.downloaded_paths = {}
+        
         self.logger.info("Advanced rar2fs Installer initialized")
         
     def setup_logging(self):
@@ -78,41 +148,308 @@ class AdvancedRarFSInstaller:
         )
         self.logger = logging.getLogger(__name__)
 
+    def cleanup(self):
+        """Release network resources held by the installer"""
+        self.session.close()
+
+    @staticmethod
+    def _detect_admin():
+        """Query the OS for admin privileges"""
+        try:
+            import ctypes
+            return bool(ctypes.windll.shell32.IsUserAnAdmin())
+        except (AttributeError, OSError):
+            # Not on Windows, or shell32 unavailable
+            return False
+
     def check_admin_privileges(self):
         """Check if running with admin privileges"""
+        return self._is_admin
+
+    def _load_cache_meta(self, cached_path):
+        """Load the ETag/Last-Modified sidecar for a cached download, if still valid"""
+        meta_path = cached_path.with_name(cached_path.name + '.meta')
         try:
-            import ctypes
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # A size mismatch means the cached copy is truncated; force a full download
+        if not cached_path.exists() or cached_path.stat().st_size != meta.get('size'):
+            return None
+        # Entries without a digest predate integrity tracking
+        if not meta.get('sha256'):
+            return None
+        return meta
+
+    def _save_cache_meta(self, cached_path, response, size, sha256):
+        """Persist the validators and digest needed to reuse a download next run"""
+        meta_path = cached_path.with_name(cached_path.name + '.meta')
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'size': size,
+            'sha256': sha256
+        }
+        try:
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache metadata for {cached_path.name}: {e}")
+
+    def _load_pinned_sha256(self):
+        """Load digests recorded for versioned downloads on previous runs"""
+        try:
+            with open(self.pinned_sha256_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _expected_digest(self, name, pinned):
+        """Return the digest a download must match, or None for mutable URLs"""
+        if name in self.mutable_downloads:
+            return None
+        return self.expected_sha256.get(name) or pinned.get(name)
+
+    def _save_pinned_sha256(self, pinned):
+        """Persist digests of versioned downloads so later runs can verify them"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.pinned_sha256_path, 'w', encoding='utf-8') as f:
+                json.dump(pinned, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not record pinned digests: {e}")
+
+    @staticmethod
+    def _file_sha256(path):
+        """Hash a file on disk in DOWNLOAD_CHUNK_SIZE blocks"""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _verify_authenticode(self, path, signer):
+        """Check that path carries a valid Authenticode signature from signer"""
+        command = (f"$s = Get-AuthenticodeSignature -LiteralPath '{path}'; "
+                   "$s.Status.ToString(); $s.SignerCertificate.Subject")
+        try:
+            result = subprocess.run(['powershell', '-NoProfile', '-Command', command],
+                                    capture_output=True, text=True, timeout=60)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            self.logger.error(f"ERROR: Could not check the signature of {Path(path).name}: {e}")
+            return False
+        
+        lines = result.stdout.splitlines()
+        if result.returncode != 0 or not lines or lines[0].strip() != 'Valid':
+            self.logger.error(f"ERROR: {Path(path).name} does not carry a valid signature")
             return False
+        if signer not in ''.join(lines[1:]):
+            self.logger.error(f"ERROR: {Path(path).name} is not signed by {signer}")
+            return False
+        return True
+
+    def _cache_path_for(self, url):
+        """Return the content-addressed cache location for a URL"""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / f"{key}-{Path(urlparse(url).path).name}"
 
-    def download_file(self, url, dest_path, description):
-        """Download a file with progress indication"""
+    def _stage_cached_file(self, cached_path, dest_path):
+        """Place a cached download at dest_path, hardlinking when possible"""
+        if dest_path is None:
+            return
+        dest_path = Path(dest_path)
+        if dest_path.exists():
+            dest_path.unlink()
         try:
+            os.link(cached_path, dest_path)
+        except OSError:
+            # Cross-volume or unsupported filesystem
+            shutil.copy2(cached_path, dest_path)
+
+    def download_file(self, url, dest_path, description, revalidate=True, expected_sha256=None):
+        """Download a file with progress indication, reusing the cached copy when unchanged.
+        
+        Returns the SHA-256 hex digest of the file, or None on failure.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cached_path = self._cache_path_for(url)
+            meta = self._load_cache_meta(cached_path)
+            # Hash the cached bytes rather than trusting the digest recorded beside them
+            if meta and expected_sha256 and self._file_sha256(cached_path) != expected_sha256:
+                self.logger.warning(f"Cached {description} does not match its pinned digest, re-downloading")
+                meta = None
+            
+            # Versioned artifacts never change for a given URL; skip the network entirely
+            if meta and not revalidate:
+                self._stage_cached_file(cached_path, dest_path)
+                self.logger.info(f"SUCCESS: {description} found in download cache")
+                return meta['sha256']
+            
+            # Send validators from the previous download so the server can answer 304
+            headers = {}
+            if meta:
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+            
             self.logger.info(f"Downloading {description}...")
-            response = requests.get(url, stream=True)
+            response = self.session.get(url, stream=True, timeout=(10, 60), headers=headers)
+            
+            if response.status_code == 304:
+                response.close()
+                self._stage_cached_file(cached_path, dest_path)
+                self.logger.info(f"SUCCESS: {description} is unchanged, reused cached copy")
+                return meta['sha256']
+            
             response.raise_for_status()
             
             total_size = int(response.headers.get('content-length', 0))
             downloaded = 0
+            part_path = cached_path.with_name(cached_path.name + '.part')
+            digest = hashlib.sha256()
             
-            with open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            with open(part_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
+                        digest.update(chunk)
                         downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            print(f"\rProgress: {progress:.1f}%", end='', flush=True)
             
-            print()  # New line after progress
-            self.logger.info(f"SUCCESS: {description} downloaded successfully")
-            return True
+            if total_size > 0 and downloaded != total_size:
+                part_path.unlink()
+                raise IOError(f"truncated download ({downloaded} of {total_size} bytes)")
+            
+            sha256 = digest.hexdigest()
+            if expected_sha256 and sha256 != expected_sha256:
+                part_path.unlink()
+                raise IOError(f"SHA-256 mismatch (expected {expected_sha256}, got {sha256})")
+            
+            os.replace(part_path, cached_path)
+            self._save_cache_meta(cached_path, response, downloaded, sha256)
+            self._stage_cached_file(cached_path, dest_path)
+            # Downloads run in parallel, so report one line per file instead of a shared progress line
+            self.logger.info(f"SUCCESS: {description} downloaded successfully "
+                             f"({downloaded / (1 << 20):.1f} MiB, sha256 {sha256})")
+            return sha256
             
         except Exception as e:
             self.logger.error(f"ERROR: Failed to download {description}: {e}")
+            return None
+
+    def prefetch_all(self):
+        """Download all installer artifacts concurrently before any build step"""
+        # Source archives are extracted straight from the cache, so they are not staged
+        jobs = [
+            ('unrar_source', None, "UnRAR source"),
+            ('rar2fs_source', None, "rar2fs source"),
+        ]
+        if not self.check_winfsp_installed():
+            jobs.append(('winfsp', self.temp_dir / "winfsp.msi", "WinFSP installer"))
+        if not self.check_cygwin_installed():
+            jobs.append(('cygwin_setup', self.temp_dir / "setup-x86_64.exe", "Cygwin setup"))
+        
+        pinned = self._load_pinned_sha256()
+        self.logger.info(f"Prefetching {len(jobs)} downloads in parallel...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                name: executor.submit(self.download_file, self.downloads[name], dest, desc,
+                                      name in self.mutable_downloads, self._expected_digest(name, pinned))
+                for name, dest, desc in jobs
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        
+        # Retry WinFSP from the fallback mirror if the primary URL failed
+        if 'winfsp' in results and results['winfsp'] is None:
+            self.logger.info("Primary WinFSP download failed, trying fallback URL...")
+            results['winfsp'] = self.download_file(
+                self.downloads['winfsp_fallback'], self.temp_dir / "winfsp.msi", "WinFSP installer (fallback)",
+                revalidate=False, expected_sha256=self._expected_digest('winfsp', pinned))
+        
+        # Reject signed artifacts whose signature does not check out, before they are pinned
+        for name, dest, _ in jobs:
+            signer = self.authenticode_signers.get(name)
+            if signer and results[name] and not self._verify_authenticode(dest, signer):
+                results[name] = None
+        
+        # Record first-seen digests of versioned downloads for later runs to enforce
+        new_pins = {
+            name: results[name] for name, _, _ in jobs
+            if results[name] and name not in self.mutable_downloads and not self._expected_digest(name, pinned)
+        }
+        if new_pins:
+            pinned.update(new_pins)
+            self._save_pinned_sha256(pinned)
+        
+        for name, dest, desc in jobs:
+            if results[name]:
+                self.downloaded_paths[name] = dest if dest is not None else self._cache_path_for(self.downloads[name])
+            else:
+                self.logger.error(f"ERROR: Failed to prefetch {desc}")
+        
+        return all(results.values())
+
+    def run_elevated_setup(self):
+        """Run every admin-only operation in a single elevated PowerShell session"""
+        try:
+            operations = []
+            
+            msi_path = self.downloaded_paths.get('winfsp')
+            if msi_path is not None and not self.check_winfsp_installed():
+                # Start-Process does not fail on a non-zero exit code, so check it here;
+                # 3010 only means a reboot is pending
+                operations.append(f'$p = Start-Process msiexec -ArgumentList "/i `"{msi_path}`" /quiet /norestart" -Wait -PassThru')
+                operations.append('if ($p.ExitCode -and $p.ExitCode -ne 3010) { exit $p.ExitCode }')
+            
+            # Create the install dir; it keeps the default Program Files ACLs, so the
+            # binaries are later copied in by an elevated step as well
+            if not self.install_dir.exists():
+                operations.append(f'New-Item -ItemType Directory -Path "{self.install_dir}" -Force | Out-Null')
+            
+            if not operations:
+                self.logger.info("Administrator setup not needed, skipping")
+                return True
+            
+            return self._run_powershell_script(operations, "elevated.ps1", "Administrator setup", timeout=600)
+                
+        except Exception as e:
+            self.logger.error(f"ERROR: Administrator setup failed: {e}")
             return False
 
+    def _run_powershell_script(self, operations, script_name, description, timeout):
+        """Run PowerShell operations as administrator: directly when elevated, else behind one UAC prompt"""
+        script_path = self.temp_dir / script_name
+        with open(script_path, 'w', encoding='utf-8') as f:
+            f.write('$ErrorActionPreference = "Stop"\n')
+            f.write('\n'.join(operations) + '\n')
+        
+        if self._is_admin:
+            # Already elevated: run the script directly, no UAC round-trip
+            self.logger.info(f"Running {description.lower()}...")
+            powershell_cmd = ['powershell', '-NoProfile', '-ExecutionPolicy', 'Bypass', '-File', str(script_path)]
+        else:
+            self.logger.info(f"Running {description.lower()} (single UAC prompt)...")
+            powershell_cmd = [
+                'powershell', '-Command',
+                f"$p = Start-Process powershell -ArgumentList '-NoProfile','-ExecutionPolicy','Bypass','-File','\"{script_path}\"' "
+                "-Verb RunAs -Wait -PassThru; exit $p.ExitCode"
+            ]
+        
+        try:
+            result = subprocess.run(powershell_cmd, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"ERROR: {description} timed out")
+            return False
+        
+        if result.returncode == 0:
+            self.logger.info(f"SUCCESS: {description} completed")
+            return True
+        self.logger.error(f"ERROR: {description} failed with code {result.returncode}")
+        return False
+
     def install_winfsp(self):
         """Install WinFSP filesystem driver"""
         try:
@@ -121,26 +458,28 @@ class AdvancedRarFSInstaller:
                 self.logger.info("WinFSP is already installed")
                 return True
                 
-            # Download WinFSP installer
-            msi_path = self.temp_dir / "winfsp.msi"
-            
-            if not self.download_file(self.downloads['winfsp'], msi_path, "WinFSP installer"):
-                self.logger.info("Primary WinFSP download failed, trying fallback URL...")
-                if not self.download_file(self.downloads['winfsp_fallback'], msi_path, "WinFSP installer (fallback)"):
-                    self.logger.error("ERROR: Both WinFSP download URLs failed")
-                    return False
+            # WinFSP installer is fetched by prefetch_all()
+            msi_path = self.downloaded_paths.get('winfsp')
+            if msi_path is None:
+                self.logger.error("ERROR: Both WinFSP download URLs failed")
+                return False
 
             # Install WinFSP silently (requires admin privileges)
             self.logger.info("Installing WinFSP (this may take a few minutes)...")
             self.logger.info("Note: This installation requires administrator privileges")
             
-            # Run MSI with elevated privileges using PowerShell
-            powershell_cmd = [
-                'powershell', '-Command',
-                f'Start-Process msiexec -ArgumentList "/i", "{msi_path}", "/quiet", "/norestart" -Verb RunAs -Wait'
-            ]
+            if self._is_admin:
+                # Already elevated: invoke msiexec directly
+                install_cmd = ['msiexec', '/i', str(msi_path), '/quiet', '/norestart']
+            else:
+                # Run MSI with elevated privileges using PowerShell
+                install_cmd = [
+                    'powershell', '-Command',
+                    f'$p = Start-Process msiexec -ArgumentList "/i", "{msi_path}", "/quiet", "/norestart" '
+                    '-Verb RunAs -Wait -PassThru; exit $p.ExitCode'
+                ]
             
-            result = subprocess.run(powershell_cmd, timeout=300)  # 5 minute timeout
+            result = subprocess.run(install_cmd, timeout=300)  # 5 minute timeout
             
             if result.returncode == 0:
                 self.logger.info("SUCCESS: WinFSP installed successfully!")
@@ -170,9 +509,10 @@ class AdvancedRarFSInstaller:
         try:
             self.logger.info("Installing Cygwin with build tools...")
             
-            # Download Cygwin setup
-            setup_path = self.temp_dir / "setup-x86_64.exe"
-            if not self.download_file(self.downloads['cygwin_setup'], setup_path, "Cygwin setup"):
+            # Cygwin setup is fetched by prefetch_all()
+            setup_path = self.downloaded_paths.get('cygwin_setup')
+            if setup_path is None:
+                self.logger.error("ERROR: Cygwin setup was not downloaded")
                 return False
             
             # Prepare package list
@@ -212,8 +552,10 @@ class AdvancedRarFSInstaller:
         """Check if Cygwin is already installed"""
         return self.cygwin_root.exists() and (self.cygwin_root / "bin" / "bash.exe").exists()
 
-    def run_cygwin_command(self, command, working_dir=None):
-        """Run a command in Cygwin environment"""
+    async def run_cygwin_command_async(self, command, working_dir=None):
+        """Run a command in Cygwin environment without blocking the event loop"""
+        # Pass working_dir instead of embedding a cd, which would be doubled up
+        assert not command.startswith("cd "), "use working_dir instead of 'cd' in Cygwin commands"
         try:
             bash_exe = self.cygwin_root / "bin" / "bash.exe"
             if not bash_exe.exists():
@@ -232,42 +574,83 @@ class AdvancedRarFSInstaller:
             else:
                 full_command = command
             
-            self.logger.info(f"Running Cygwin command: {command}")
-            result = subprocess.run(
-                [str(bash_exe), '-l', '-c', full_command],
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=600  # 10 minute timeout
+            self.logger.info("Running Cygwin command: %s", command)
+            proc = await asyncio.create_subprocess_exec(
+                str(bash_exe), '-l', '-c', full_command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env=env
             )
             
-            if result.stdout:
-                self.logger.info(f"Command output: {result.stdout}")
-            if result.stderr:
-                self.logger.warning(f"Command stderr: {result.stderr}")
-                
-            return result.returncode == 0
+            tail = collections.deque(maxlen=20)
+            try:
+                # Stream output line by line so long builds show progress
+                await asyncio.wait_for(self._log_process_output(proc, tail), timeout=600)  # 10 minute timeout
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                self.logger.error("ERROR: Command timed out: %s", command)
+                return False
+            
+            if proc.returncode != 0:
+                # Surface the end of the build log even when DEBUG output is muted
+                self.logger.error("ERROR: Command failed with code %s: %s\n%s", proc.returncode, command,
+                                  b''.join(tail).decode('utf-8', errors='replace').rstrip())
+                return False
+            return True
             
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"ERROR: Command timed out: {command}")
-            return False
         except Exception as e:
-            self.logger.error(f"ERROR: Failed to run Cygwin command '{command}': {e}")
+            self.logger.error("ERROR: Failed to run Cygwin command '%s': %s", command, e)
             return False
 
+    async def _log_process_output(self, proc, tail):
+        """Log a subprocess's combined output at DEBUG as it is produced, keeping a short tail"""
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        async for line in proc.stdout:
+            tail.append(line)
+            if debug:
+                self.logger.debug("%s", line.decode('utf-8', errors='replace').rstrip())
+        await proc.wait()
+
+    def run_cygwin_command(self, command, working_dir=None):
+        """Run a command in Cygwin environment"""
+        return asyncio.run(self.run_cygwin_command_async(command, working_dir))
+
     def windows_to_cygwin_path(self, windows_path):
         """Convert Windows path to Cygwin path format"""
-        path = Path(windows_path).resolve()
-        path_str = str(path).replace('\\', '/')
-        
-        # Convert C: to /cygdrive/c
-        if path_str[1:3] == ':/':
-            drive = path_str[0].lower()
-            path_str = f"/cygdrive/{drive}{path_str[2:]}"
-        
-        return path_str
+        return _win_to_cygwin(str(windows_path))
+
+    @staticmethod
+    def _is_unsafe_member(name):
+        """Check whether an archive member name would land outside the destination"""
+        normalized = name.replace('\\', '/')
+        return (normalized.startswith('/') or (len(normalized) > 1 and normalized[1] == ':')
+                or '..' in normalized.split('/'))
+
+    @staticmethod
+    def _extract_tar(archive_path, dest_dir):
+        """Extract a gzipped tarball into dest_dir, rejecting members that escape it"""
+        with tarfile.open(archive_path, 'r:gz') as tf:
+            if hasattr(tarfile, 'data_filter'):
+                tf.extractall(dest_dir, filter='data')
+                return
+            for member in tf.getmembers():
+                if (AdvancedRarFSInstaller._is_unsafe_member(member.name)
+                        or (member.issym() or member.islnk())
+                        and AdvancedRarFSInstaller._is_unsafe_member(member.linkname)):
+                    raise tarfile.TarError(f"unsafe path in archive: {member.name}")
+            tf.extractall(dest_dir)
 
-    def download_and_compile_unrar(self):
+    @staticmethod
+    def _extract_zip(archive_path, dest_dir):
+        """Extract a zip archive into dest_dir, rejecting members that escape it"""
+        with zipfile.ZipFile(archive_path) as zf:
+            for name in zf.namelist():
+                if AdvancedRarFSInstaller._is_unsafe_member(name):
+                    raise zipfile.BadZipFile(f"unsafe path in archive: {name}")
+            zf.extractall(dest_dir)
+
+    async def download_and_compile_unrar(self):
         """Download and compile UnRAR source library"""
         try:
             self.logger.info("Downloading and compiling UnRAR source library...")
@@ -276,21 +659,27 @@ class AdvancedRarFSInstaller:
             build_dir = self.temp_dir / "unrar_build"
             build_dir.mkdir(exist_ok=True)
             
-            # Download UnRAR source
-            unrar_tar = build_dir / "unrarsrc.tar.gz"
-            if not self.download_file(self.downloads['unrar_source'], unrar_tar, "UnRAR source"):
+            # UnRAR source is fetched by prefetch_all()
+            if 'unrar_source' not in self.downloaded_paths:
+                self.logger.error("ERROR: UnRAR source was not downloaded")
                 return False
             
-            # Extract UnRAR source in Cygwin
-            if not self.run_cygwin_command(f"cd '{self.windows_to_cygwin_path(build_dir)}' && tar -zxf unrarsrc.tar.gz"):
-                self.logger.error("ERROR: Failed to extract UnRAR source")
+            # Extract UnRAR source in-process
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._extract_tar, self.downloaded_paths['unrar_source'], build_dir)
+            except (OSError, tarfile.TarError) as e:
+                self.logger.error(f"ERROR: Failed to extract UnRAR source: {e}")
                 return False
             
             # Compile UnRAR library
             unrar_dir = build_dir / "unrar"
-            if not self.run_cygwin_command("make lib", unrar_dir):
-                self.logger.error("ERROR: Failed to compile UnRAR library")
-                return False
+            if not await self.run_cygwin_command_async(f"make -j{self.make_jobs} lib", unrar_dir):
+                # Retry serially in case the makefile is not parallel-safe
+                self.logger.warning("Parallel UnRAR build failed, retrying with a single job")
+                if not await self.run_cygwin_command_async("make lib", unrar_dir):
+                    self.logger.error("ERROR: Failed to compile UnRAR library")
+                    return False
             
             self.logger.info("SUCCESS: UnRAR library compiled successfully!")
             return True
@@ -299,6 +688,49 @@ class AdvancedRarFSInstaller:
             self.logger.error(f"ERROR: UnRAR compilation failed: {e}")
             return False
 
+    async def prepare_rar2fs_source(self):
+        """Extract rar2fs source and generate its build system"""
+        try:
+            self.logger.info("Preparing rar2fs source...")
+            
+            # Create build directory
+            build_dir = self.temp_dir / "rar2fs_build"  
+            build_dir.mkdir(exist_ok=True)
+            
+            # rar2fs source is fetched by prefetch_all()
+            if 'rar2fs_source' not in self.downloaded_paths:
+                self.logger.error("ERROR: rar2fs source was not downloaded")
+                return False
+            
+            # Extract rar2fs source in-process
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._extract_zip, self.downloaded_paths['rar2fs_source'], build_dir)
+            except (OSError, zipfile.BadZipFile) as e:
+                self.logger.error(f"ERROR: Failed to extract rar2fs source: {e}")
+                return False
+            
+            # Run autoreconf
+            rar2fs_source_dir = build_dir / "rar2fs-master"
+            if not await self.run_cygwin_command_async("autoreconf -fi", rar2fs_source_dir):
+                self.logger.error("ERROR: Failed to run autoreconf")
+                return False
+            
+            self.logger.info("SUCCESS: rar2fs source prepared successfully!")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"ERROR: rar2fs source preparation failed: {e}")
+            return False
+
+    async def build_sources_concurrently(self):
+        """Compile UnRAR while the independent rar2fs source preparation runs"""
+        unrar_ok, rar2fs_ok = await asyncio.gather(
+            self.download_and_compile_unrar(),
+            self.prepare_rar2fs_source()
+        )
+        return unrar_ok and rar2fs_ok
+
     def install_cygfuse(self):
         """Install Cygfuse (WinFSP integration for Cygwin)"""
         try:
@@ -311,8 +743,7 @@ class AdvancedRarFSInstaller:
                 return False
             
             # Run Cygfuse install script
-            cygfuse_path = self.windows_to_cygwin_path(cygfuse_dir)
-            if not self.run_cygwin_command(f"cd '{cygfuse_path}' && ./install.sh"):
+            if not self.run_cygwin_command("./install.sh", cygfuse_dir):
                 self.logger.error("ERROR: Failed to install Cygfuse")
                 return False
             
@@ -324,33 +755,12 @@ class AdvancedRarFSInstaller:
             return False
 
     def download_and_compile_rar2fs(self):
-        """Download and compile rar2fs from source"""
+        """Configure, compile and install rar2fs from the prepared source"""
         try:
-            self.logger.info("Downloading and compiling rar2fs...")
-            
-            # Create build directory
-            build_dir = self.temp_dir / "rar2fs_build"  
-            build_dir.mkdir(exist_ok=True)
+            self.logger.info("Compiling rar2fs...")
             
-            # Download rar2fs source
-            rar2fs_zip = build_dir / "rar2fs-master.zip"
-            if not self.download_file(self.downloads['rar2fs_source'], rar2fs_zip, "rar2fs source"):
-                return False
-            
-            # Extract rar2fs source in Cygwin
-            build_cygwin_path = self.windows_to_cygwin_path(build_dir)
-            if not self.run_cygwin_command(f"cd '{build_cygwin_path}' && unzip -q rar2fs-master.zip"):
-                self.logger.error("ERROR: Failed to extract rar2fs source")
-                return False
-            
-            # Prepare build environment
-            rar2fs_source_dir = build_dir / "rar2fs-master"
-            rar2fs_cygwin_path = self.windows_to_cygwin_path(rar2fs_source_dir)
-            
-            # Run autoreconf
-            if not self.run_cygwin_command("autoreconf -fi", rar2fs_source_dir):
-                self.logger.error("ERROR: Failed to run autoreconf")
-                return False
+            # Source was extracted and autoreconf'd by prepare_rar2fs_source()
+            rar2fs_source_dir = self.temp_dir / "rar2fs_build" / "rar2fs-master"
             
             # Configure build
             unrar_lib_path = self.windows_to_cygwin_path(self.temp_dir / "unrar_build" / "unrar")
@@ -360,12 +770,15 @@ class AdvancedRarFSInstaller:
                 return False
             
             # Compile rar2fs
-            if not self.run_cygwin_command("make", rar2fs_source_dir):
-                self.logger.error("ERROR: Failed to compile rar2fs")
-                return False
+            if not self.run_cygwin_command(f"make -j{self.make_jobs}", rar2fs_source_dir):
+                # Retry serially in case the makefile is not parallel-safe
+                self.logger.warning("Parallel rar2fs build failed, retrying with a single job")
+                if not self.run_cygwin_command("make", rar2fs_source_dir):
+                    self.logger.error("ERROR: Failed to compile rar2fs")
+                    return False
             
-            # Install rar2fs
-            if not self.run_cygwin_command("make install", rar2fs_source_dir):
+            # Install rar2fs (kept serial; parallel installs are prone to races)
+            if not self.run_cygwin_command("make -j1 install", rar2fs_source_dir):
                 self.logger.error("ERROR: Failed to install rar2fs")
                 return False
             
@@ -376,34 +789,110 @@ class AdvancedRarFSInstaller:
             self.logger.error(f"ERROR: rar2fs compilation failed: {e}")
             return False
 
+    @staticmethod
+    def _copy_file(src, dst):
+        """Copy a file with a large buffer, preserving metadata like shutil.copy2"""
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+        shutil.copystat(src, dst)
+
+    def _stage_binary(self, src, dst):
+        """Hardlink src into the install directory, copying when linking is not possible"""
+        dst = Path(dst)
+        if dst.exists():
+            dst.unlink()
+        try:
+            # Same-volume hardlinks are a metadata update instead of a full copy
+            os.link(src, dst)
+        except OSError:
+            self._copy_file(src, dst)
+
+    def _read_dll_imports(self, binary_path):
+        """Return the cyg*.dll names imported by a PE binary, via Cygwin objdump"""
+        objdump = self.cygwin_root / "bin" / "objdump.exe"
+        result = subprocess.run([str(objdump), '-p', str(binary_path)],
+                                capture_output=True, text=True, timeout=60)
+        if result.returncode != 0:
+            raise RuntimeError(f"objdump failed on {binary_path}: {result.stderr.strip()}")
+        
+        imports = set()
+        for line in result.stdout.splitlines():
+            line = line.strip()
+            if line.startswith('DLL Name:'):
+                name = line.split(':', 1)[1].strip()
+                if name.lower().startswith('cyg'):
+                    imports.add(name)
+        return imports
+
+    def resolve_dll_closure(self, exe_path):
+        """Walk the import tables of exe_path to find every Cygwin DLL it needs"""
+        stat = exe_path.stat()
+        fingerprint = {'size': stat.st_size, 'mtime': stat.st_mtime}
+        
+        # Reuse the closure from a previous run if the executable is unchanged
+        try:
+            with open(self.dll_closure_cache, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('fingerprint') == fingerprint:
+                return cached['dlls']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        try:
+            bin_dir = self.cygwin_root / "bin"
+            closure = set()
+            pending = list(self._read_dll_imports(exe_path))
+            while pending:
+                dll = pending.pop(0)
+                if dll in closure:
+                    continue
+                closure.add(dll)
+                dll_path = bin_dir / dll
+                if dll_path.exists():
+                    pending.extend(self._read_dll_imports(dll_path) - closure)
+        except (OSError, RuntimeError, subprocess.TimeoutExpired) as e:
+            self.logger.warning(f"Could not resolve DLL dependencies, using default list: {e}")
+            return self.default_dlls
+        
+        dlls = sorted(closure)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.dll_closure_cache, 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint, 'dlls': dlls}, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Could not cache DLL closure: {e}")
+        
+        self.logger.info(f"rar2fs requires {len(dlls)} Cygwin DLLs: {', '.join(dlls)}")
+        return dlls
+
     def setup_windows_integration(self):
         """Set up Windows integration for rar2fs"""
         try:
             self.logger.info("Setting up Windows integration...")
             
-            # Create installation directory
-            self.install_dir.mkdir(parents=True, exist_ok=True)
+            # Without admin rights Program Files is read-only, so stage the files in the
+            # temp dir and copy them into place with one elevated step at the end
+            if self._is_admin:
+                target_dir = self.install_dir
+            else:
+                target_dir = self.temp_dir / "rar2fs_stage"
+            target_dir.mkdir(parents=True, exist_ok=True)
             
             # Copy rar2fs executable to Windows accessible location
             rar2fs_exe = self.cygwin_root / "usr" / "local" / "bin" / "rar2fs.exe"
             if rar2fs_exe.exists():
-                target_exe = self.install_dir / "rar2fs.exe"
-                shutil.copy2(rar2fs_exe, target_exe)
+                target_exe = target_dir / "rar2fs.exe"
+                self._stage_binary(rar2fs_exe, target_exe)
                 self.logger.info(f"Copied rar2fs.exe to {target_exe}")
             
-            # Copy required Cygwin DLLs
-            dll_files = [
-                "cygwin1.dll",
-                "cygfuse-2.dll", 
-                "cyggcc_s-seh-1.dll",
-                "cygstdc++-6.dll"
-            ]
+            # Copy the Cygwin DLLs rar2fs.exe actually links against
+            dll_files = self.resolve_dll_closure(rar2fs_exe) if rar2fs_exe.exists() else self.default_dlls
             
             for dll in dll_files:
                 dll_path = self.cygwin_root / "bin" / dll
                 if dll_path.exists():
-                    target_dll = self.install_dir / dll
-                    shutil.copy2(dll_path, target_dll)
+                    target_dll = target_dir / dll
+                    self._stage_binary(dll_path, target_dll)
                     self.logger.info(f"Copied {dll} to installation directory")
             
             # Create wrapper script for easier Windows usage
@@ -417,10 +906,18 @@ set PATH=%RAR2FS_DIR%;%PATH%
 "%RAR2FS_DIR%\\rar2fs.exe" %*
 '''
             
-            wrapper_path = self.install_dir / "rar2fs.bat"
+            wrapper_path = target_dir / "rar2fs.bat"
             with open(wrapper_path, 'w') as f:
                 f.write(wrapper_content)
             
+            if not self._is_admin:
+                operations = [
+                    f'New-Item -ItemType Directory -Path "{self.install_dir}" -Force | Out-Null',
+                    f'Copy-Item -Path "{target_dir}\\*" -Destination "{self.install_dir}" -Force',
+                ]
+                if not self._run_powershell_script(operations, "install_files.ps1", "Installing rar2fs files", timeout=300):
+                    return False
+            
             self.logger.info("SUCCESS: Windows integration set up successfully!")
             return True
             
@@ -442,6 +939,19 @@ set PATH=%RAR2FS_DIR%;%PATH%
             print()
 
         try:
+            # Fetch every artifact up front so network transfers overlap
+            print("Downloading installer components...")
+            if not self.prefetch_all():
+                print("ERROR: Failed to download installer components")
+                return False
+            print()
+
+            # Batch the admin-only work (WinFSP MSI, install directory) behind one UAC prompt;
+            # the individual steps below fall back to their own elevation if this is declined
+            if not self.run_elevated_setup():
+                print("WARNING: Administrator setup did not complete, continuing step by step")
+            print()
+
             # Step 1: Install WinFSP
             print("STEP 1/6: Installing WinFSP filesystem driver...")
             if not self.install_winfsp():
@@ -461,10 +971,10 @@ set PATH=%RAR2FS_DIR%;%PATH%
                 print("SUCCESS: Cygwin installation completed!")
             print()
 
-            # Step 3: Download and compile UnRAR
-            print("STEP 3/6: Downloading and compiling UnRAR library...")
-            if not self.download_and_compile_unrar():
-                print("ERROR: Failed to compile UnRAR library")
+            # Step 3: Compile UnRAR and prepare rar2fs source concurrently
+            print("STEP 3/6: Compiling UnRAR library and preparing rar2fs source...")
+            if not asyncio.run(self.build_sources_concurrently()):
+                print("ERROR: Failed to compile UnRAR library or prepare rar2fs source")
                 return False
             print("SUCCESS: UnRAR library compilation completed!")
             print()
@@ -477,8 +987,8 @@ set PATH=%RAR2FS_DIR%;%PATH%
             print("SUCCESS: Cygfuse installation completed!")
             print()
 
-            # Step 5: Download and compile rar2fs
-            print("STEP 5/6: Downloading and compiling rar2fs...")
+            # Step 5: Compile rar2fs
+            print("STEP 5/6: Compiling rar2fs...")
             if not self.download_and_compile_rar2fs():
                 print("ERROR: Failed to compile rar2fs")
                 return False
@@ -535,7 +1045,10 @@ def main():
     try:
         installer = AdvancedRarFSInstaller()
         
-        success = installer.run_installation()
+        try:
+            success = installer.run_installation()
+        finally:
+            installer.cleanup()
         if success:
             installer.print_success_message()
         else:
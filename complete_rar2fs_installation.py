@@ -9,34 +9,63 @@ that failed due to permission issues in the automated installer.
 
 import os
 import subprocess
+import tempfile
 from pathlib import Path
 
-def create_installation_directory():
-    """Create rar2fs installation directory with admin privileges"""
-    print("Creating rar2fs installation directory...")
+def _detect_admin():
+    """Check once whether this process already has admin privileges"""
+    try:
+        import ctypes
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (AttributeError, OSError):
+        return False
+
+IS_ADMIN = _detect_admin()
+
+def run_elevated_install(local_wrapper):
+    """Create the installation directory and install the wrapper in one elevated session"""
+    print("Installing rar2fs wrapper to Program Files (one UAC prompt)...")
     
+    script_path = None
     try:
-        # Use PowerShell with admin privileges to create directory
-        powershell_cmd = [
-            'powershell', '-Command',
-            'Start-Process powershell -ArgumentList "-Command", "New-Item -ItemType Directory -Path \\"C:\\Program Files\\rar2fs\\" -Force; Write-Host Done" -Verb RunAs -Wait'
-        ]
+        # Batch every admin-only operation into a single script so UAC prompts once
+        script_content = f"""$ErrorActionPreference = "Stop"
+New-Item -ItemType Directory -Path "C:\\Program Files\\rar2fs" -Force | Out-Null
+Copy-Item "{local_wrapper.absolute()}" "C:\\Program Files\\rar2fs\\" -Force
+"""
+        with tempfile.NamedTemporaryFile('w', suffix='.ps1', prefix='rar2fs_install_', delete=False) as f:
+            f.write(script_content)
+            script_path = Path(f.name)
+        
+        if IS_ADMIN:
+            # Already elevated: run the script in-process, skipping Start-Process/UAC
+            powershell_cmd = ['powershell', '-ExecutionPolicy', 'Bypass', '-File', str(script_path)]
+        else:
+            # -PassThru exposes the elevated script's exit code, which Start-Process otherwise drops
+            powershell_cmd = [
+                'powershell', '-Command',
+                f'$p = Start-Process powershell -ArgumentList "-ExecutionPolicy", "Bypass", "-File", "\\"{script_path}\\"" '
+                '-Verb RunAs -Wait -PassThru; exit $p.ExitCode'
+            ]
         
         result = subprocess.run(powershell_cmd, timeout=60)
         
         if result.returncode == 0:
-            print("SUCCESS: Installation directory created!")
+            print("SUCCESS: Installation directory created and wrapper installed!")
             return True
         else:
-            print(f"ERROR: Failed to create directory (code {result.returncode})")
+            print(f"ERROR: Elevated installation failed (code {result.returncode})")
             return False
             
     except Exception as e:
-        print(f"ERROR: Directory creation failed: {e}")
+        print(f"ERROR: Elevated installation failed: {e}")
         return False
+    finally:
+        if script_path is not None:
+            script_path.unlink(missing_ok=True)
 
 def create_windows_wrapper():
-    """Create a Windows batch wrapper for rar2fs"""
+    """Create a Windows batch wrapper for rar2fs in the current directory"""
     print("Creating Windows wrapper for rar2fs...")
     
     try:
@@ -59,31 +88,17 @@ C:\\cygwin64\\bin\\bash.exe -l -c "rar2fs %*"
 endlocal
 """
 
-        # Write to local directory first (no admin required)
+        # Write to local directory (no admin required); run_elevated_install copies it
         local_wrapper = Path("rar2fs.bat")
         with open(local_wrapper, 'w') as f:
             f.write(wrapper_content)
         
         print(f"Created wrapper: {local_wrapper.absolute()}")
-        
-        # Copy to Program Files with admin privileges
-        powershell_cmd = [
-            'powershell', '-Command',
-            f'Start-Process powershell -ArgumentList "-Command", "Copy-Item \\"{local_wrapper.absolute()}\\" \\"C:\\Program Files\\rar2fs\\" -Force; Write-Host Done" -Verb RunAs -Wait'
-        ]
-        
-        result = subprocess.run(powershell_cmd, timeout=60)
-        
-        if result.returncode == 0:
-            print("SUCCESS: Windows wrapper installed!")
-            return True
-        else:
-            print(f"ERROR: Failed to install wrapper (code {result.returncode})")
-            return False
+        return local_wrapper
             
     except Exception as e:
         print(f"ERROR: Wrapper creation failed: {e}")
-        return False
+        return None
 
 def create_usage_guide():
     """Create a usage guide for rar2fs"""
@@ -181,12 +196,13 @@ def main():
     
     success = True
     
-    # Step 1: Create installation directory
-    if not create_installation_directory():
+    # Step 1: Create Windows wrapper locally
+    local_wrapper = create_windows_wrapper()
+    if local_wrapper is None:
         success = False
     
-    # Step 2: Create Windows wrapper
-    if success and not create_windows_wrapper():
+    # Step 2: Create installation directory and install wrapper (single elevation)
+    if success and not run_elevated_install(local_wrapper):
         success = False
     
     # Step 3: Create usage guide
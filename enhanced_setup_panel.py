@@ -6,21 +6,301 @@ Includes processing mode selection for each directory pair
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import json
+import logging
 import os
-import yaml
+import copy
+import functools
+import hashlib
+import importlib.util
+import ipaddress
+import random
 from pathlib import Path
-import threading
 import subprocess
-import requests
-import xml.etree.ElementTree as ET
+import tempfile
+import concurrent.futures
+import time
+
+logger = logging.getLogger(__name__)
+
+# requests, yaml and the XML parser are imported where they are used so that
+# building the panel does not pay for them up front.
+
+# Optional HTTP response caching (checked without importing it)
+REQUESTS_CACHE_AVAILABLE = importlib.util.find_spec('requests_cache') is not None
+
+# Optional binary copy of the YAML config for faster reloads
+MSGPACK_AVAILABLE = importlib.util.find_spec('msgpack') is not None
+
+# Optional default gateway lookup without spawning route/ipconfig
+try:
+    import netifaces
+    NETIFACES_AVAILABLE = True
+except ImportError:
+    NETIFACES_AVAILABLE = False
+
+def _detect_admin():
+    """Check once whether this process already has admin privileges"""
+    try:
+        import ctypes
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except (AttributeError, OSError):
+        return False
+
+IS_ADMIN = _detect_admin()
+
+# Keeps command-line probes from flashing a console window on Windows
+NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Machine-generated caches live per user, outside the checkout
+CACHE_DIR = Path(os.environ.get('LOCALAPPDATA', tempfile.gettempdir())) / 'PlexRarBridge' / 'cache'
+
+def _find_rar2fs_installer():
+    """Locate advanced_rar2fs_installer.py next to this module or in the installation directory"""
+    for installer_path in (
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "advanced_rar2fs_installer.py"),
+        r"C:\Program Files\PlexRarBridge\advanced_rar2fs_installer.py",
+    ):
+        if os.path.exists(installer_path):
+            return installer_path
+    return None
+
+RAR2FS_INSTALLER_PATH = _find_rar2fs_installer()
+
+def _is_ipv4(text):
+    """Return True if text is a dotted-quad IPv4 address"""
+    try:
+        ipaddress.IPv4Address(text)
+        return True
+    except ValueError:
+        return False
+
+def _configure_label_styles(master):
+    """Register the shared label styles used for static hint and heading text"""
+    style = ttk.Style(master)
+    style.configure('Info.TLabel', foreground='blue')
+    style.configure('Warn.TLabel', foreground='orange')
+    style.configure('Muted.TLabel', foreground='gray')
+    style.configure('SmallWarn.TLabel', foreground='orange', font=('TkDefaultFont', 8))
+    style.configure('Heading.TLabel', font=('TkDefaultFont', 10, 'bold'))
+    style.configure('Title.TLabel', font=('TkDefaultFont', 12, 'bold'))
+
+# Seconds a successful UPnP router discovery is reused
+UPNP_DISCOVERY_TTL = 60
+
+# Seconds a parsed Plex library sections response is reused by automatic connection tests
+PLEX_SECTIONS_TTL = 30
+
+# Attempts for a Plex request that fails with a connection error, timeout or 5xx status;
+# retries back off exponentially (with jitter) up to PLEX_RETRY_MAX_DELAY seconds
+PLEX_RETRY_ATTEMPTS = 3
+PLEX_RETRY_MAX_DELAY = 8
+
+# Plex libraries from the last successful connection test, kept across restarts for this many seconds
+PROBE_CACHE_FILE = 'plex_probe_cache.json'
+PROBE_CACHE_TTL = 3600
+
+# Shown when UPnP discovery finds no router
+UPNP_TROUBLESHOOTING_TEMPLATE = """UPnP router not found. Here's how to fix it:
+
+1. ENABLE UPnP ON YOUR ROUTER:
+   • Open your router's web interface: http://{router_ip}
+   • Look for 'UPnP' or 'Universal Plug and Play' settings
+   • Enable UPnP if it's disabled
+
+2. COMMON LOCATIONS:
+   • Advanced → UPnP
+   • Network → UPnP  
+   • Firewall → UPnP
+   • Services → UPnP
+
+3. WINDOWS FIREWALL:
+   • Allow 'UPnP Device Host' and 'UPnP Device Discovery'
+   • Enable for both Private and Public networks
+
+4. ALTERNATIVE - MANUAL PORT FORWARDING:
+   • Port: 8765 (TCP)
+   • Internal IP: {local_ip}
+   • External Port: 8765 → Internal Port: 8765
+
+5. REBOOT:
+   • Reboot your router after enabling UPnP
+   • Wait 2-3 minutes and test again
+
+Your router IP: {router_ip}
+Your computer IP: {local_ip}
+
+Note: Enhanced UPnP discovery with multiple methods attempted."""
+
+# rar2fs installation dialogs
+RAR2FS_ADMIN_REQUIRED_MESSAGE = """rar2fs installation requires administrator privileges.
+
+The installation process will:
+• Install WinFSP with complete components
+• Install Cygwin with development tools
+• Download and compile UnRAR library
+• Download and compile rar2fs from source
+• Create Windows integration wrapper
+
+This process may take 15-30 minutes.
+
+Would you like to restart as administrator?"""
+
+RAR2FS_INSTALLER_MISSING_MESSAGE = """Enhanced rar2fs installer not found.
+
+Please ensure advanced_rar2fs_installer.py is available."""
+
+RAR2FS_INSTALL_CONFIRM_MESSAGE = """Enhanced rar2fs installation will:
+
+⏱️ Time: 15-30 minutes
+💾 Space: 2-4 GB additional disk space
+🌐 Network: Downloads required components
+
+This installs a complete rar2fs system with:
+• WinFSP with all components
+• Cygwin development environment
+• Latest rar2fs compiled from source
+• Windows wrapper for easy usage
+
+Continue with installation?"""
+
+RAR2FS_INSTALL_OK_TEMPLATE = """rar2fs has been installed successfully!
+
+Components installed:
+• WinFSP (Windows File System Proxy)
+• Cygwin with development tools
+• UnRAR library
+• rar2fs v1.29.7 compiled from source
+• Windows wrapper for easy usage
+
+rar2fs is available at:
+{rar2fs_exe}
+
+You can now use rar2fs processing mode!"""
+
+RAR2FS_INSTALL_FAILED_TEMPLATE = """rar2fs installation failed.
+
+Error output:
+{stderr}
+
+Please check the installation logs for details."""
+
+# Listbox icon per Plex library type (anything else gets a folder)
+LIBRARY_TYPE_ICONS = {'movie': '📽️', 'show': '📺'}
+
+# Directory pair rows inserted per event-loop turn
+PAIRS_TREE_BATCH = 100
+
+# Status label updates within this many milliseconds are coalesced into one redraw
+STATUS_DEBOUNCE_MS = 50
+
+def _initial_dir(*candidates):
+    """Return the first non-empty candidate path for a file dialog, else the home directory"""
+    for candidate in candidates:
+        if candidate:
+            return candidate
+    return os.path.expanduser('~')
+
+def _centered_geometry(parent, width, height):
+    """Return a geometry string placing a width x height window over the middle of parent"""
+    x = parent.winfo_rootx() + (parent.winfo_width() - width) // 2
+    y = parent.winfo_rooty() + (parent.winfo_height() - height) // 2
+    return f"{width}x{height}+{max(x, 0)}+{max(y, 0)}"
+
+def _build_mode_tree(master, processing_modes, variable, columns):
+    """Build a single-selection Treeview listing the processing modes, kept in sync with variable"""
+    tree = ttk.Treeview(master, columns=columns, show='tree headings',
+                        selectmode='browse', height=len(processing_modes))
+    tree.heading('#0', text='Mode')
+    tree.column('#0', width=160, stretch=False)
+    for column in columns:
+        tree.heading(column, text=column.capitalize())
+    
+    # One row per mode, with the mode id as the item id
+    for mode_id, mode_info in processing_modes.items():
+        tree.insert('', 'end', iid=mode_id, text=mode_info['name'],
+                    values=[mode_info[column] for column in columns])
+    
+    def on_select(event):
+        selection = tree.selection()
+        if selection:
+            variable.set(selection[0])
+    
+    tree.bind('<<TreeviewSelect>>', on_select)
+    if tree.exists(variable.get()):
+        tree.selection_set(variable.get())
+    return tree
 
 class EnhancedSetupPanel:
     """Enhanced setup panel with processing mode selection"""
     
+    # Fixed attribute layout; the single panel instance never grows new attributes
+    __slots__ = (
+        '_canvas', '_executor', '_global_mode_trace', '_http', '_install_executor', '_install_future', '_mode_info_strings', '_mode_name', '_net_info_future', '_pair_by_iid', '_probe_cache',
+        '_pairs_render_job', '_plex_library_titles', '_plex_sections_cache', '_rar2fs_mount_options', '_rar2fs_mounts_content',
+        '_scroll_after_id', '_setup_mod', '_status_after_ids', '_tab_builders', '_tab_status', '_upnp_cache', '_upnp_managers',
+        '_upnp_settings_built', '_upnp_stateful_widgets', 'auto_start_var',
+        'config_notebook', 'delete_archives_var', 'duplicate_check_var',
+        'extraction_status_label', 'extraction_work_var', 'global_mode_info_label',
+        'global_mode_var', 'libraries_listbox', 'omdb_api_key_entry', 'omdb_api_key_var',
+        'pairs_scroll', 'pairs_tree', 'parent', 'plex_host_entry', 'plex_host_var',
+        'plex_status_label', 'plex_token_entry', 'plex_token_var', 'processing_modes',
+        'rar2fs_auto_cleanup_var', 'rar2fs_exe_var', 'rar2fs_mount_base_var',
+        'rar2fs_mounts_text', 'rar2fs_options_text', 'rar2fs_service_status_label',
+        'rar2fs_status_label', 'rar2fs_timeout_var', 'rar2fs_unmount_timeout_var',
+        'rar2fs_verify_mounts_var', 'recursive_var', 'script_dir', 'setup_data',
+        'setup_frame', 'setup_status_label', 'test_all_button', 'upnp_enabled_var', 'upnp_lease_var',
+        'upnp_retry_var', 'upnp_settings_frame', 'upnp_status_label', 'upnp_timeout_var',
+        'vfs_mount_base_var', 'vfs_port_end_var', 'vfs_port_start_var', 'vfs_status_label',
+    )
+    
+    # Parsed config files keyed by path, validated by modification time
+    _CONFIG_CACHE = {}
+    
     def __init__(self, parent, script_dir):
         self.parent = parent
         self.script_dir = Path(script_dir)
         
+        _configure_label_styles(parent)
+        
+        # HTTP session for Plex requests, created on first use
+        self._http = None
+        
+        # setup.py module with the Plex discovery helpers, imported on first use
+        self._setup_mod = None
+        
+        # Background worker for network probes; UPnP managers are reused per settings
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='setup-io')
+        self._upnp_managers = {}
+        # Separate single worker for the long-running rar2fs installer, so installs never overlap
+        self._install_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='rar2fs-install')
+        self._install_future = None
+        # Local IP and default gateway, resolved off the UI thread
+        self._net_info_future = self._executor.submit(self._prefetch_net_info)
+        # (timestamp, settings key, status) of the last successful router discovery
+        self._upnp_cache = None
+        
+        # Pending scroll region update for the main canvas
+        self._canvas = None
+        self._scroll_after_id = None
+        
+        # Pending batch insert for long directory pair lists
+        self._pairs_render_job = None
+        
+        # Results of running rar2fs/unrar, keyed by (executable path, mtime)
+        self._probe_cache = {}
+        
+        # Pending coalesced status label updates, keyed by label attribute name
+        self._status_after_ids = {}
+        
+        # Directory pair dict shown by each pairs tree row
+        self._pair_by_iid = {}
+        
+        # (timestamp, parsed root) of the last Plex library sections response, keyed by (host, token)
+        self._plex_sections_cache = {}
+        
+        # Library titles offered by the directory pair dialog, rebuilt when the libraries change
+        self._plex_library_titles = ()
+        
         # Setup data
         self.setup_data = {
             'directory_pairs': [],
@@ -52,18 +332,30 @@ class EnhancedSetupPanel:
             }
         }
         
+        # Display name per mode for the directory pairs tree
+        self._mode_name = {mode_id: mode_info['name'] for mode_id, mode_info in self.processing_modes.items()}
+        
+        # Info line and recommendation color shown for each mode
+        mode_colors = {'python_vfs': 'green', 'extraction': 'orange'}
+        self._mode_info_strings = {
+            mode_id: (f"Dependencies: {mode_info['dependencies']} | Complexity: {mode_info['complexity']}",
+                      mode_colors.get(mode_id, 'red'))
+            for mode_id, mode_info in self.processing_modes.items()
+        }
+        
         # Create the enhanced setup frame and return it
         self.setup_frame = self.create_enhanced_setup_panel()
         # DO NOT add the frame to the parent notebook here - let gui_monitor handle it
+        self.setup_frame.bind('<Destroy>', self._on_setup_frame_destroyed, add='+')
         
         # Load existing setup
         self.load_setup_config()
         
-        # Test all configurations
-        self.test_all_configs()
+        # Initialize UPnP settings state (builds the settings only if enabled)
+        self.toggle_upnp_settings()
         
-        # Auto-refresh rar2fs status on startup (silent)
-        self.parent.after(1000, self.silent_refresh_rar2fs_status)  # Refresh after 1 second
+        # Test all configurations, together with the silent rar2fs status refresh
+        self.test_all_configs(include_rar2fs_status=True)
     
     def create_enhanced_setup_panel(self):
         """Create enhanced setup panel with processing mode selection"""
@@ -74,11 +366,9 @@ class EnhancedSetupPanel:
         canvas = tk.Canvas(setup_frame)
         scrollbar = ttk.Scrollbar(setup_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
+        self._canvas = canvas
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -87,27 +377,39 @@ class EnhancedSetupPanel:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Create sections
-        self.create_processing_mode_info_section(scrollable_frame)
-        self.create_global_processing_mode_section(scrollable_frame)
-        self.create_plex_connection_section(scrollable_frame)
-        self.create_enhanced_directory_pairs_section(scrollable_frame)
-        self.create_processing_mode_config_section(scrollable_frame)
-        self.create_upnp_config_section(scrollable_frame)
-        self.create_enhanced_setup_controls_section(scrollable_frame)
+        # Create sections; size propagation is held off until all of them are packed
+        # so the frame is resized (and the scroll region recomputed) once
+        scrollable_frame.pack_propagate(False)
+        try:
+            self.create_processing_mode_info_section(scrollable_frame)
+            self.create_global_processing_mode_section(scrollable_frame)
+            self.create_plex_connection_section(scrollable_frame)
+            self.create_enhanced_directory_pairs_section(scrollable_frame)
+            self.create_processing_mode_config_section(scrollable_frame)
+            self.create_upnp_config_section(scrollable_frame)
+            self.create_enhanced_setup_controls_section(scrollable_frame)
+        finally:
+            scrollable_frame.pack_propagate(True)
         
         return setup_frame
     
+    def _schedule_scrollregion(self, event=None):
+        """Recompute the canvas scroll region once a burst of resizes settles"""
+        if self._scroll_after_id:
+            self.parent.after_cancel(self._scroll_after_id)
+        self._scroll_after_id = self.parent.after(50, self._update_scrollregion)
+    
+    def _update_scrollregion(self):
+        """Fit the canvas scroll region to its contents"""
+        self._scroll_after_id = None
+        self._canvas.configure(scrollregion=self._canvas.bbox("all"))
+    
     def create_processing_mode_info_section(self, parent):
         """Create processing mode information section"""
         info_frame = ttk.LabelFrame(parent, text="Processing Mode Information", padding=15)
         info_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        # Create info text
-        info_text = tk.Text(info_frame, height=8, width=80, wrap=tk.WORD)
-        info_scrollbar = ttk.Scrollbar(info_frame, orient=tk.VERTICAL, command=info_text.yview)
-        info_text.configure(yscrollcommand=info_scrollbar.set)
-        
+        # Static, read-only content: a wrapped label is enough
         info_content = """
 🎯 PROCESSING MODES EXPLAINED:
 
@@ -123,11 +425,7 @@ class EnhancedSetupPanel:
 You can assign different processing modes to different directories based on your needs!
         """
         
-        info_text.insert(tk.END, info_content.strip())
-        info_text.config(state=tk.DISABLED)
-        
-        info_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        info_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        ttk.Label(info_frame, text=info_content.strip(), wraplength=700, justify=tk.LEFT).pack(fill=tk.X)
     
     def create_global_processing_mode_section(self, parent):
         """Create global processing mode selection"""
@@ -143,82 +441,57 @@ You can assign different processing modes to different directories based on your
         
         self.global_mode_var = tk.StringVar(value='python_vfs')
         
-        for mode_id, mode_info in self.processing_modes.items():
-            mode_radio_frame = ttk.Frame(mode_frame)
-            mode_radio_frame.pack(fill=tk.X, pady=2)
-            
+        for row, (mode_id, mode_info) in enumerate(self.processing_modes.items()):
             ttk.Radiobutton(
-                mode_radio_frame,
+                mode_frame,
                 text=mode_info['name'],
                 variable=self.global_mode_var,
-                value=mode_id,
-                command=self.update_global_mode_info
-            ).pack(side=tk.LEFT)
+                value=mode_id
+            ).grid(row=row, column=0, sticky=tk.W, pady=2)
             
-            tk.Label(
-                mode_radio_frame,
+            ttk.Label(
+                mode_frame,
                 text=f"- {mode_info['description']}",
-                foreground='gray'
-            ).pack(side=tk.LEFT, padx=(10, 0))
+                style='Muted.TLabel'
+            ).grid(row=row, column=1, sticky=tk.W, padx=(10, 0), pady=2)
         
         # Global mode info
-        self.global_mode_info_frame = ttk.Frame(global_frame)
-        self.global_mode_info_frame.pack(fill=tk.X, pady=(10, 0))
-        
-        self.global_mode_info_label = tk.Label(self.global_mode_info_frame, text="")
-        self.global_mode_info_label.pack(anchor=tk.W)
+        self.global_mode_info_label = tk.Label(global_frame, text="")
+        self.global_mode_info_label.pack(anchor=tk.W, pady=(10, 0))
         
-        # Update info initially
+        # Keep the info line in sync with the variable, including when a config is loaded
+        # Kept so teardown can drop the trace callback, which holds a reference to the panel
+        self._global_mode_trace = self.global_mode_var.trace_add('write', lambda *_: self.update_global_mode_info())
         self.update_global_mode_info()
     
     def update_global_mode_info(self):
         """Update global processing mode information"""
-        mode = self.global_mode_var.get()
-        mode_info = self.processing_modes[mode]
-        
-        info_text = f"Dependencies: {mode_info['dependencies']} | Complexity: {mode_info['complexity']}"
-        self.global_mode_info_label.config(text=info_text)
-        
-        # Update recommendation color
-        if mode == 'python_vfs':
-            self.global_mode_info_label.config(foreground='green')
-        elif mode == 'extraction':
-            self.global_mode_info_label.config(foreground='orange')
-        else:
-            self.global_mode_info_label.config(foreground='red')
+        text, color = self._mode_info_strings[self.global_mode_var.get()]
+        self.global_mode_info_label.config(text=text, foreground=color)
     
     def create_plex_connection_section(self, parent):
         """Create Plex connection configuration"""
         plex_frame = ttk.LabelFrame(parent, text="Plex Server Connection", padding=15)
         plex_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        # Server URL
-        ttk.Label(plex_frame, text="Plex Server URL:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.plex_host_var = tk.StringVar()
-        self.plex_host_entry = ttk.Entry(plex_frame, textvariable=self.plex_host_var, width=50)
-        self.plex_host_entry.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=5)
-        
-        ttk.Button(plex_frame, text="Auto-Detect", command=self.auto_detect_plex).grid(row=0, column=2, padx=(10, 0), pady=5)
-        
-        # Token
-        ttk.Label(plex_frame, text="Plex Token:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.plex_token_var = tk.StringVar()
-        self.plex_token_entry = ttk.Entry(plex_frame, textvariable=self.plex_token_var, width=50, show="*")
-        self.plex_token_entry.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=5)
-        
-        ttk.Button(plex_frame, text="Auto-Detect", command=self.auto_detect_token).grid(row=1, column=2, padx=(10, 0), pady=5)
-        
-        # OMDB API Key
-        ttk.Label(plex_frame, text="OMDB API Key:").grid(row=2, column=0, sticky=tk.W, pady=5)
-        self.omdb_api_key_var = tk.StringVar()
-        self.omdb_api_key_entry = ttk.Entry(plex_frame, textvariable=self.omdb_api_key_var, width=50, show="*")
-        self.omdb_api_key_entry.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=5)
-        
-        ttk.Button(plex_frame, text="Get Key", command=self.open_omdb_website).grid(row=2, column=2, padx=(10, 0), pady=5)
+        # (label, attribute prefix, entry show character, button text, button command)
+        fields = (
+            ("Plex Server URL:", 'plex_host', '', "Auto-Detect", self.auto_detect_plex),
+            ("Plex Token:", 'plex_token', '*', "Auto-Detect", self.auto_detect_token),
+            ("OMDB API Key:", 'omdb_api_key', '*', "Get Key", self.open_omdb_website),
+        )
+        for row, (label, name, show, button_text, command) in enumerate(fields):
+            ttk.Label(plex_frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=5)
+            var = tk.StringVar()
+            entry = ttk.Entry(plex_frame, textvariable=var, width=50, show=show)
+            entry.grid(row=row, column=1, sticky=tk.W, padx=(10, 0), pady=5)
+            ttk.Button(plex_frame, text=button_text, command=command).grid(row=row, column=2, padx=(10, 0), pady=5)
+            setattr(self, f'{name}_var', var)
+            setattr(self, f'{name}_entry', entry)
         
         # OMDB API Key info
         omdb_info = ttk.Label(plex_frame, text="Required for FTP IMDb info feature. Get your free API key at omdbapi.com", 
-                             foreground='blue')
+                             style='Info.TLabel')
         omdb_info.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(0, 5))
         
         # Connection status
@@ -261,29 +534,29 @@ You can assign different processing modes to different directories based on your
         instructions = ttk.Label(pairs_frame, 
                                text="Configure source directories with their target directories and choose processing mode for each pair.\n" +
                                "Different directories can use different processing modes based on your needs.",
-                               foreground='blue')
+                               style='Info.TLabel')
         instructions.pack(pady=(0, 10))
         
         # Directory pairs tree with processing mode column
-        columns = ('Source Directory', 'Target Directory', 'Processing Mode', 'Plex Library', 'Status')
+        cols = (
+            ('Source Directory', 200),
+            ('Target Directory', 200),
+            ('Processing Mode', 150),
+            ('Plex Library', 150),
+            ('Status', 100)
+        )
+        columns = tuple(name for name, _ in cols)
         self.pairs_tree = ttk.Treeview(pairs_frame, columns=columns, show='headings', height=10)
         
-        # Configure columns
-        self.pairs_tree.heading('Source Directory', text='Source Directory')
-        self.pairs_tree.heading('Target Directory', text='Target Directory')
-        self.pairs_tree.heading('Processing Mode', text='Processing Mode')
-        self.pairs_tree.heading('Plex Library', text='Plex Library')
-        self.pairs_tree.heading('Status', text='Status')
-        
-        self.pairs_tree.column('Source Directory', width=200)
-        self.pairs_tree.column('Target Directory', width=200)
-        self.pairs_tree.column('Processing Mode', width=150)
-        self.pairs_tree.column('Plex Library', width=150)
-        self.pairs_tree.column('Status', width=100)
+        # Configure columns (fixed widths skip proportional resizing on <Configure>)
+        for name, width in cols:
+            self.pairs_tree.heading(name, text=name)
+            self.pairs_tree.column(name, width=width, stretch=False)
         
         # Scrollbar for pairs tree
         pairs_scroll = ttk.Scrollbar(pairs_frame, orient=tk.VERTICAL, command=self.pairs_tree.yview)
         self.pairs_tree.configure(yscrollcommand=pairs_scroll.set)
+        self.pairs_scroll = pairs_scroll
         
         # Pack tree and scrollbar
         tree_frame = ttk.Frame(pairs_frame)
@@ -307,36 +580,132 @@ You can assign different processing modes to different directories based on your
         config_frame = ttk.LabelFrame(parent, text="Processing Mode Configuration", padding=15)
         config_frame.pack(fill=tk.X, padx=10, pady=5)
         
+        # Settings variables exist up front; tab widgets are built on first selection
+        self.create_processing_mode_vars()
+        
         # Mode-specific configuration
         self.config_notebook = ttk.Notebook(config_frame)
         self.config_notebook.pack(fill=tk.X, pady=5)
         
-        # Python VFS Config
-        self.create_python_vfs_config_tab()
+        self._tab_builders = {}
+        for index, (title, builder) in enumerate((
+            ("Python VFS", self.create_python_vfs_config_tab),
+            ("rar2fs", self.create_rar2fs_config_tab),
+            ("Extraction", self.create_extraction_config_tab)
+        )):
+            placeholder = ttk.Frame(self.config_notebook)
+            self.config_notebook.add(placeholder, text=title)
+            self._tab_builders[index] = (builder, placeholder)
+        
+        self.config_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Build the initially selected tab now
+        self._on_tab_changed()
+    
+    def _on_tab_changed(self, event=None):
+        """Build a processing mode tab the first time it is selected"""
+        entry = self._tab_builders.pop(self.config_notebook.index("current"), None)
+        if entry:
+            builder, frame = entry
+            builder(frame)
+    
+    def create_processing_mode_vars(self):
+        """Create the variables backing the processing mode tabs"""
+        # Python VFS
+        self.vfs_port_start_var = tk.StringVar(value='8765')
+        self.vfs_port_end_var = tk.StringVar(value='8865')
+        self.vfs_mount_base_var = tk.StringVar(value='C:/PlexRarBridge/mounts')
+        
+        # rar2fs
+        self.rar2fs_exe_var = tk.StringVar(value='C:/Program Files/PlexRarBridge/rar2fs/bin/rar2fs.exe')
+        self.rar2fs_mount_base_var = tk.StringVar(value='C:/PlexRarBridge/rar2fs_mounts')
+        self.rar2fs_timeout_var = tk.StringVar(value='60')
+        self.rar2fs_unmount_timeout_var = tk.StringVar(value='30')
+        self.rar2fs_auto_cleanup_var = tk.BooleanVar(value=True)
+        self.rar2fs_verify_mounts_var = tk.BooleanVar(value=True)
+        self._rar2fs_mount_options = ['uid=-1', 'gid=-1', 'allow_other']
+        self._rar2fs_mounts_content = ''
         
-        # rar2fs Config
-        self.create_rar2fs_config_tab()
+        # Extraction
+        self.extraction_work_var = tk.StringVar(value='C:/PlexRarBridge/work')
+        self.delete_archives_var = tk.BooleanVar(value=True)
+        self.duplicate_check_var = tk.BooleanVar(value=True)
         
-        # Extraction Config
-        self.create_extraction_config_tab()
+        # Widgets owned by lazily built tabs
+        self.rar2fs_options_text = None
+        self.rar2fs_mounts_text = None
+        self.vfs_status_label = None
+        self.rar2fs_status_label = None
+        self.rar2fs_service_status_label = None
+        self.extraction_status_label = None
+        
+        # Latest status per label, shown when the owning tab is built
+        self._tab_status = {
+            'vfs_status_label': ("✅ Python VFS: Ready (No dependencies required)", 'green'),
+            'rar2fs_status_label': ("❌ rar2fs: Not installed", 'red'),
+            'rar2fs_service_status_label': ("🔍 Checking service status...", 'blue'),
+            'extraction_status_label': ("✅ Extraction: Ready (UnRAR required)", 'green')
+        }
     
-    def create_python_vfs_config_tab(self):
+    def _create_status_label(self, parent, name):
+        """Create a tab status label showing its most recent status"""
+        text, color = self._tab_status[name]
+        label = tk.Label(parent, text=text, foreground=color)
+        setattr(self, name, label)
+        return label
+    
+    def _set_status(self, name, text, color):
+        """Update a tab status label, or remember the status until its tab is built"""
+        self._tab_status[name] = (text, color)
+        label = getattr(self, name)
+        if label is not None:
+            label.config(text=text, foreground=color)
+    
+    def _schedule_status(self, name, text, color):
+        """Like _set_status, but coalesce rapid updates of the same label into one redraw"""
+        self._tab_status[name] = (text, color)
+        if name not in self._status_after_ids:
+            self._status_after_ids[name] = self.parent.after(STATUS_DEBOUNCE_MS, self._flush_status, name)
+    
+    def _flush_status(self, name):
+        """Apply the latest scheduled status of a label"""
+        del self._status_after_ids[name]
+        self._set_status(name, *self._tab_status[name])
+    
+    def _set_mounts_text(self, content):
+        """Update the active mounts display"""
+        self._rar2fs_mounts_content = content
+        if self.rar2fs_mounts_text is not None:
+            self.rar2fs_mounts_text.config(state=tk.NORMAL)
+            self.rar2fs_mounts_text.delete('1.0', tk.END)
+            self.rar2fs_mounts_text.insert(tk.END, content)
+            self.rar2fs_mounts_text.config(state=tk.DISABLED)
+    
+    def _get_rar2fs_mount_options(self):
+        """Return the rar2fs mount options as a list of lines"""
+        if self.rar2fs_options_text is not None:
+            return self.rar2fs_options_text.get('1.0', tk.END).strip().splitlines()
+        return list(self._rar2fs_mount_options)
+    
+    def _set_rar2fs_mount_options(self, options):
+        """Set the rar2fs mount options"""
+        self._rar2fs_mount_options = list(options)
+        if self.rar2fs_options_text is not None:
+            self.rar2fs_options_text.delete('1.0', tk.END)
+            self.rar2fs_options_text.insert(tk.END, '\n'.join(options))
+    
+    def create_python_vfs_config_tab(self, vfs_frame):
         """Create Python VFS configuration tab"""
-        vfs_frame = ttk.Frame(self.config_notebook)
-        self.config_notebook.add(vfs_frame, text="Python VFS")
         
         # Python VFS settings
-        ttk.Label(vfs_frame, text="Python VFS Configuration:", font=('TkDefaultFont', 10, 'bold')).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(vfs_frame, text="Python VFS Configuration:", style='Heading.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
         # HTTP Server Port Range
         port_frame = ttk.Frame(vfs_frame)
         port_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(port_frame, text="HTTP Server Port Range:").pack(side=tk.LEFT)
-        self.vfs_port_start_var = tk.StringVar(value='8765')
         ttk.Entry(port_frame, textvariable=self.vfs_port_start_var, width=10).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Label(port_frame, text="to").pack(side=tk.LEFT)
-        self.vfs_port_end_var = tk.StringVar(value='8865')
         ttk.Entry(port_frame, textvariable=self.vfs_port_end_var, width=10).pack(side=tk.LEFT, padx=(5, 10))
         
         # Mount base directory
@@ -344,40 +713,19 @@ You can assign different processing modes to different directories based on your
         mount_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(mount_frame, text="Mount Base Directory:").pack(side=tk.LEFT)
-        self.vfs_mount_base_var = tk.StringVar(value='C:/PlexRarBridge/mounts')
         ttk.Entry(mount_frame, textvariable=self.vfs_mount_base_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(mount_frame, text="Browse", command=self.browse_mount_base).pack(side=tk.LEFT)
         
         # Status
-        self.vfs_status_label = tk.Label(vfs_frame, text="✅ Python VFS: Ready (No dependencies required)", foreground='green')
-        self.vfs_status_label.pack(anchor=tk.W, pady=(10, 0))
+        self._create_status_label(vfs_frame, 'vfs_status_label').pack(anchor=tk.W, pady=(10, 0))
     
-    def create_rar2fs_config_tab(self):
-        """Create rar2fs configuration tab"""
-        rar2fs_frame = ttk.Frame(self.config_notebook)
-        self.config_notebook.add(rar2fs_frame, text="rar2fs")
-        
-        # Create main scrollable container
-        canvas = tk.Canvas(rar2fs_frame)
-        scrollbar = ttk.Scrollbar(rar2fs_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
+    def create_rar2fs_config_tab(self, rar2fs_frame):
+        """Create rar2fs configuration tab (scrolled by the panel's canvas, not one of its own)"""
         # rar2fs settings
-        ttk.Label(scrollable_frame, text="rar2fs Configuration & Management:", font=('TkDefaultFont', 12, 'bold')).pack(anchor=tk.W, pady=(0, 15))
+        ttk.Label(rar2fs_frame, text="rar2fs Configuration & Management:", style='Title.TLabel').pack(anchor=tk.W, pady=(0, 15))
         
         # === Configuration Section ===
-        config_section = ttk.LabelFrame(scrollable_frame, text="Configuration", padding=10)
+        config_section = ttk.LabelFrame(rar2fs_frame, text="Configuration", padding=10)
         config_section.pack(fill=tk.X, pady=5, padx=5)
         
         # Executable path
@@ -385,7 +733,6 @@ You can assign different processing modes to different directories based on your
         exe_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(exe_frame, text="rar2fs Executable:").pack(side=tk.LEFT)
-        self.rar2fs_exe_var = tk.StringVar(value='C:/Program Files/PlexRarBridge/rar2fs/bin/rar2fs.exe')
         ttk.Entry(exe_frame, textvariable=self.rar2fs_exe_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(exe_frame, text="Browse", command=self.browse_rar2fs_exe).pack(side=tk.LEFT)
         
@@ -394,7 +741,6 @@ You can assign different processing modes to different directories based on your
         mount_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(mount_frame, text="Mount Base Directory:").pack(side=tk.LEFT)
-        self.rar2fs_mount_base_var = tk.StringVar(value='C:/PlexRarBridge/rar2fs_mounts')
         ttk.Entry(mount_frame, textvariable=self.rar2fs_mount_base_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(mount_frame, text="Browse", command=self.browse_rar2fs_mount_base).pack(side=tk.LEFT)
         
@@ -405,10 +751,10 @@ You can assign different processing modes to different directories based on your
         ttk.Label(options_frame, text="Mount Options:").pack(anchor=tk.W)
         self.rar2fs_options_text = tk.Text(options_frame, height=3, width=60)
         self.rar2fs_options_text.pack(pady=(5, 0))
-        self.rar2fs_options_text.insert(tk.END, "uid=-1\ngid=-1\nallow_other")
+        self.rar2fs_options_text.insert(tk.END, '\n'.join(self._rar2fs_mount_options))
         
         # === Service Management Section ===
-        service_section = ttk.LabelFrame(scrollable_frame, text="Service Management", padding=10)
+        service_section = ttk.LabelFrame(rar2fs_frame, text="Service Management", padding=10)
         service_section.pack(fill=tk.X, pady=5, padx=5)
         
         # Service controls
@@ -420,11 +766,10 @@ You can assign different processing modes to different directories based on your
         ttk.Button(service_controls_frame, text="🔁 Restart rar2fs Service", command=self.restart_rar2fs_service).pack(side=tk.LEFT, padx=5)
         
         # Service status
-        self.rar2fs_service_status_label = tk.Label(service_section, text="🔍 Checking service status...", foreground='blue')
-        self.rar2fs_service_status_label.pack(anchor=tk.W, pady=(10, 5))
+        self._create_status_label(service_section, 'rar2fs_service_status_label').pack(anchor=tk.W, pady=(10, 5))
         
         # === Mount Management Section ===
-        mount_section = ttk.LabelFrame(scrollable_frame, text="Mount Management", padding=10)
+        mount_section = ttk.LabelFrame(rar2fs_frame, text="Mount Management", padding=10)
         mount_section.pack(fill=tk.X, pady=5, padx=5)
         
         # Mount controls
@@ -440,11 +785,13 @@ You can assign different processing modes to different directories based on your
         mounts_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(mounts_frame, text="Active Mounts:").pack(anchor=tk.W)
-        self.rar2fs_mounts_text = tk.Text(mounts_frame, height=4, width=80, state=tk.DISABLED)
+        self.rar2fs_mounts_text = tk.Text(mounts_frame, height=4, width=80)
+        self.rar2fs_mounts_text.insert(tk.END, self._rar2fs_mounts_content)
+        self.rar2fs_mounts_text.config(state=tk.DISABLED)
         self.rar2fs_mounts_text.pack(pady=(5, 0), fill=tk.X)
         
         # === Installation & Testing Section ===
-        install_section = ttk.LabelFrame(scrollable_frame, text="Installation & Testing", padding=10)
+        install_section = ttk.LabelFrame(rar2fs_frame, text="Installation & Testing", padding=10)
         install_section.pack(fill=tk.X, pady=5, padx=5)
         
         # Installation and testing controls
@@ -456,11 +803,10 @@ You can assign different processing modes to different directories based on your
         ttk.Button(install_controls_frame, text="🔧 Check Dependencies", command=self.check_rar2fs_dependencies).pack(side=tk.LEFT, padx=5)
         
         # Status
-        self.rar2fs_status_label = tk.Label(install_section, text="❌ rar2fs: Not installed", foreground='red')
-        self.rar2fs_status_label.pack(anchor=tk.W, pady=(10, 0))
+        self._create_status_label(install_section, 'rar2fs_status_label').pack(anchor=tk.W, pady=(10, 0))
         
         # === Advanced Options Section ===
-        advanced_section = ttk.LabelFrame(scrollable_frame, text="Advanced Options", padding=10)
+        advanced_section = ttk.LabelFrame(rar2fs_frame, text="Advanced Options", padding=10)
         advanced_section.pack(fill=tk.X, pady=5, padx=5)
         
         # Advanced settings
@@ -472,21 +818,17 @@ You can assign different processing modes to different directories based on your
         timeout_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(timeout_frame, text="Mount Timeout (seconds):").pack(side=tk.LEFT)
-        self.rar2fs_timeout_var = tk.StringVar(value='60')
         ttk.Entry(timeout_frame, textvariable=self.rar2fs_timeout_var, width=10).pack(side=tk.LEFT, padx=(10, 20))
         
         ttk.Label(timeout_frame, text="Unmount Timeout (seconds):").pack(side=tk.LEFT)
-        self.rar2fs_unmount_timeout_var = tk.StringVar(value='30')
         ttk.Entry(timeout_frame, textvariable=self.rar2fs_unmount_timeout_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
         
         # Auto-cleanup options
         cleanup_frame = ttk.Frame(advanced_frame)
         cleanup_frame.pack(fill=tk.X, pady=2)
         
-        self.rar2fs_auto_cleanup_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(cleanup_frame, text="Auto-cleanup on exit", variable=self.rar2fs_auto_cleanup_var).pack(side=tk.LEFT)
         
-        self.rar2fs_verify_mounts_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(cleanup_frame, text="Verify mounts on startup", variable=self.rar2fs_verify_mounts_var).pack(side=tk.LEFT, padx=(20, 0))
         
         # Refresh controls
@@ -497,20 +839,17 @@ You can assign different processing modes to different directories based on your
         ttk.Button(refresh_frame, text="📊 View Logs", command=self.view_rar2fs_logs).pack(side=tk.LEFT, padx=5)
         ttk.Button(refresh_frame, text="⚙️ Open Config File", command=self.open_rar2fs_config).pack(side=tk.LEFT, padx=5)
     
-    def create_extraction_config_tab(self):
+    def create_extraction_config_tab(self, extraction_frame):
         """Create extraction configuration tab"""
-        extraction_frame = ttk.Frame(self.config_notebook)
-        self.config_notebook.add(extraction_frame, text="Extraction")
         
         # Extraction settings
-        ttk.Label(extraction_frame, text="Extraction Configuration:", font=('TkDefaultFont', 10, 'bold')).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(extraction_frame, text="Extraction Configuration:", style='Heading.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
         # Work directory
         work_frame = ttk.Frame(extraction_frame)
         work_frame.pack(fill=tk.X, pady=5)
         
         ttk.Label(work_frame, text="Work Directory:").pack(side=tk.LEFT)
-        self.extraction_work_var = tk.StringVar(value='C:/PlexRarBridge/work')
         ttk.Entry(work_frame, textvariable=self.extraction_work_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(work_frame, text="Browse", command=self.browse_work_dir).pack(side=tk.LEFT)
         
@@ -518,15 +857,12 @@ You can assign different processing modes to different directories based on your
         options_frame = ttk.Frame(extraction_frame)
         options_frame.pack(fill=tk.X, pady=10)
         
-        self.delete_archives_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(options_frame, text="Delete archives after processing", variable=self.delete_archives_var).pack(anchor=tk.W)
         
-        self.duplicate_check_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(options_frame, text="Enable duplicate detection", variable=self.duplicate_check_var).pack(anchor=tk.W)
         
         # Status
-        self.extraction_status_label = tk.Label(extraction_frame, text="✅ Extraction: Ready (UnRAR required)", foreground='green')
-        self.extraction_status_label.pack(anchor=tk.W, pady=(10, 0))
+        self._create_status_label(extraction_frame, 'extraction_status_label').pack(anchor=tk.W, pady=(10, 0))
     
     def create_upnp_config_section(self, parent):
         """Create UPnP configuration section"""
@@ -538,40 +874,46 @@ You can assign different processing modes to different directories based on your
             "UPnP automatically configures port forwarding for Python VFS HTTP server.\n"
             "This helps bypass firewall issues and enables remote access to streamed content."
         )
-        tk.Label(upnp_frame, text=description_text, foreground='blue').pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(upnp_frame, text=description_text, style='Info.TLabel').pack(anchor=tk.W, pady=(0, 10))
         
         # UPnP enabled checkbox
         self.upnp_enabled_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(upnp_frame, text="Enable UPnP port forwarding", variable=self.upnp_enabled_var,
                        command=self.toggle_upnp_settings).pack(anchor=tk.W, pady=5)
         
-        # UPnP settings frame
+        self.upnp_timeout_var = tk.IntVar(value=10)
+        self.upnp_retry_var = tk.IntVar(value=3)
+        self.upnp_lease_var = tk.IntVar(value=3600)
+        
+        # UPnP settings frame, populated the first time UPnP is enabled
         self.upnp_settings_frame = ttk.Frame(upnp_frame)
         self.upnp_settings_frame.pack(fill=tk.X, pady=(10, 0))
+        self._upnp_settings_built = False
+    
+    def create_upnp_settings(self):
+        """Create the UPnP settings widgets"""
+        self._upnp_settings_built = True
         
         # Timeout setting
         timeout_frame = ttk.Frame(self.upnp_settings_frame)
         timeout_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(timeout_frame, text="Discovery Timeout (seconds):").pack(side=tk.LEFT)
-        self.upnp_timeout_var = tk.StringVar(value='10')
-        ttk.Entry(timeout_frame, textvariable=self.upnp_timeout_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Spinbox(timeout_frame, textvariable=self.upnp_timeout_var, from_=1, to=120, width=10).pack(side=tk.LEFT, padx=(10, 0))
         
         # Retry count
         retry_frame = ttk.Frame(self.upnp_settings_frame)
         retry_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(retry_frame, text="Retry Count:").pack(side=tk.LEFT)
-        self.upnp_retry_var = tk.StringVar(value='3')
-        ttk.Entry(retry_frame, textvariable=self.upnp_retry_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Spinbox(retry_frame, textvariable=self.upnp_retry_var, from_=1, to=10, width=10).pack(side=tk.LEFT, padx=(10, 0))
         
         # Lease duration
         lease_frame = ttk.Frame(self.upnp_settings_frame)
         lease_frame.pack(fill=tk.X, pady=2)
         
         ttk.Label(lease_frame, text="Port Lease Duration (seconds):").pack(side=tk.LEFT)
-        self.upnp_lease_var = tk.StringVar(value='3600')
-        ttk.Entry(lease_frame, textvariable=self.upnp_lease_var, width=10).pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Spinbox(lease_frame, textvariable=self.upnp_lease_var, from_=0, to=86400, increment=600, width=10).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Label(lease_frame, text="(3600 = 1 hour)").pack(side=tk.LEFT, padx=(5, 0))
         
         # UPnP status and test
@@ -592,80 +934,81 @@ You can assign different processing modes to different directories based on your
             "ℹ️ UPnP requires a compatible router and may not work on all networks.\n"
             "If UPnP fails, manual port forwarding may be required for remote access."
         )
-        tk.Label(info_frame, text=info_text, foreground='orange', font=('TkDefaultFont', 8)).pack(anchor=tk.W)
+        ttk.Label(info_frame, text=info_text, style='SmallWarn.TLabel').pack(anchor=tk.W)
         
-        # Initialize UPnP settings state
-        self.toggle_upnp_settings()
+        # Collect the widgets toggle_upnp_settings enables/disables, once
+        self._upnp_stateful_widgets = [
+            child
+            for row in self.upnp_settings_frame.winfo_children()
+            for child in row.winfo_children()
+            if isinstance(child, (ttk.Entry, ttk.Button, ttk.Label, tk.Label))
+        ]
     
     def toggle_upnp_settings(self):
         """Toggle UPnP settings visibility"""
-        if self.upnp_enabled_var.get():
-            for widget in self.upnp_settings_frame.winfo_children():
-                try:
-                    widget.configure(state='normal')
-                except:
-                    pass
-                for child in widget.winfo_children():
-                    try:
-                        child.configure(state='normal')
-                    except:
-                        pass
-        else:
-            for widget in self.upnp_settings_frame.winfo_children():
-                try:
-                    widget.configure(state='disabled')
-                except:
-                    pass
-                for child in widget.winfo_children():
-                    try:
-                        child.configure(state='disabled')
-                    except:
-                        pass
+        if not self._upnp_settings_built:
+            if not self.upnp_enabled_var.get():
+                # Nothing to disable until the settings are first shown
+                return
+            self.create_upnp_settings()
+        
+        new_state = 'normal' if self.upnp_enabled_var.get() else 'disabled'
+        for widget in self._upnp_stateful_widgets:
+            widget.configure(state=new_state)
+    
+    def _set_upnp_status(self, text, color):
+        """Update the UPnP status label from any thread"""
+        self.parent.after(0, lambda t=text, f=color: self.upnp_status_label.config(text=t, foreground=f))
+    
+    def _get_upnp_config_key(self):
+        """Read the UPnP settings on the main thread as a hashable key"""
+        return (self.upnp_timeout_var.get(),
+                self.upnp_retry_var.get(),
+                self.upnp_lease_var.get())
+    
+    def _get_upnp_manager(self, key):
+        """Return a UPnP manager for the given settings, reusing one already created"""
+        upnp = self._upnp_managers.get(key)
+        if upnp is None:
+            from upnp_port_manager import UPnPPortManager
+            
+            logger = logging.getLogger('upnp_setup')
+            logger.setLevel(logging.INFO)
+            
+            timeout, retry_count, lease_duration = key
+            config = {
+                'upnp': {
+                    'enabled': True,
+                    'timeout': timeout,
+                    'retry_count': retry_count,
+                    'lease_duration': lease_duration
+                }
+            }
+            upnp = UPnPPortManager(config, logger)
+            self._upnp_managers[key] = upnp
+        return upnp
     
     def test_upnp(self):
         """Test UPnP configuration"""
         try:
             self.upnp_status_label.config(text="Testing UPnP...", foreground='blue')
-            
-            # Test with threading to avoid blocking GUI
-            import threading
+            key = self._get_upnp_config_key()
             
             def test_upnp_worker():
                 try:
-                    # Import enhanced UPnP manager
-                    from upnp_port_manager import UPnPPortManager
-                    import logging
-                    
-                    # Create test logger
-                    logger = logging.getLogger('upnp_test')
-                    logger.setLevel(logging.INFO)
-                    
-                    # Create test config
-                    config = {
-                        'upnp': {
-                            'enabled': True,
-                            'timeout': int(self.upnp_timeout_var.get()),
-                            'retry_count': int(self.upnp_retry_var.get()),
-                            'lease_duration': int(self.upnp_lease_var.get())
-                        }
-                    }
-                    
-                    # Test enhanced UPnP
-                    upnp = UPnPPortManager(config, logger)
+                    upnp = self._get_upnp_manager(key)
                     
-                    if upnp.discover_router():
+                    if upnp.control_url or upnp.discover_router():
                         status = upnp.get_status()
                         router_ip = status.get('control_url', '').split('//')[1].split(':')[0] if status.get('control_url') else 'Unknown'
-                        self.upnp_status_label.config(text=f"✅ UPnP: Router discovered at {router_ip} and ready", foreground='green')
+                        self._set_upnp_status(f"✅ UPnP: Router discovered at {router_ip} and ready", 'green')
                     else:
-                        self.upnp_status_label.config(text="❌ UPnP: No compatible router found", foreground='red')
+                        self._set_upnp_status("❌ UPnP: No compatible router found", 'red')
                         
                 except Exception as e:
-                    self.upnp_status_label.config(text=f"❌ UPnP: Error - {str(e)}", foreground='red')
+                    self._set_upnp_status(f"❌ UPnP: Error - {str(e)}", 'red')
             
-            # Run test in thread
-            test_thread = threading.Thread(target=test_upnp_worker, daemon=True)
-            test_thread.start()
+            self._executor.submit(test_upnp_worker)
             
         except Exception as e:
             self.upnp_status_label.config(text=f"❌ UPnP: Test error - {str(e)}", foreground='red')
@@ -674,65 +1017,51 @@ You can assign different processing modes to different directories based on your
         """Discover UPnP router with detailed feedback"""
         try:
             self.upnp_status_label.config(text="Discovering UPnP router...", foreground='blue')
+            key = self._get_upnp_config_key()
+            
+            # Retry the network lookup if the startup attempt failed (e.g. no network yet)
+            if self._net_info_future.done() and self._net_info_future.exception() is not None:
+                self.refresh_network_info()
             
             def discover_worker():
                 try:
-                    from upnp_port_manager import UPnPPortManager
-                    import logging
-                    import socket
-                    
-                    logger = logging.getLogger('upnp_discover')
-                    logger.setLevel(logging.INFO)
-                    
-                    config = {
-                        'upnp': {
-                            'enabled': True,
-                            'timeout': int(self.upnp_timeout_var.get()),
-                            'retry_count': int(self.upnp_retry_var.get()),
-                            'lease_duration': int(self.upnp_lease_var.get())
-                        }
-                    }
-                    
-                    upnp = UPnPPortManager(config, logger)
+                    # Reuse a recent successful discovery for the same settings
+                    cached = self._upnp_cache
+                    if cached and cached[1] == key and time.monotonic() - cached[0] < UPNP_DISCOVERY_TTL:
+                        status = cached[2]
+                        found = True
+                    else:
+                        upnp = self._get_upnp_manager(key)
+                        found = upnp.discover_router()
+                        if found:
+                            status = upnp.get_status()
+                            self._upnp_cache = (time.monotonic(), key, status)
                     
-                    if upnp.discover_router():
-                        status = upnp.get_status()
+                    if found:
                         control_url = status.get('control_url', 'Unknown')
                         service_type = status.get('service_type', 'Unknown')
                         router_ip = control_url.split('//')[1].split(':')[0] if '//' in control_url else 'Unknown'
                         
-                        self.upnp_status_label.config(
-                            text=f"✅ UPnP: Found router at {router_ip} - {service_type.split(':')[-1]}", 
-                            foreground='green'
-                        )
+                        self._set_upnp_status(f"✅ UPnP: Found router at {router_ip} - {service_type.split(':')[-1]}", 'green')
                     else:
                         # Provide detailed troubleshooting information
                         try:
-                            # Get actual router IP (default gateway)
-                            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                            sock.connect(("8.8.8.8", 80))
-                            local_ip = sock.getsockname()[0]
-                            sock.close()
+                            # Local IP and default gateway looked up at startup
+                            local_ip, router_ip = self.get_network_info()
                             
-                            router_ip = self.get_default_gateway()
-                            
-                            self.upnp_status_label.config(
-                                text=f"❌ UPnP: No router found - Check router UPnP settings at {router_ip}", 
-                                foreground='red'
-                            )
+                            self._set_upnp_status(f"❌ UPnP: No router found - Check router UPnP settings at {router_ip}", 'red')
                             
                             # Show troubleshooting dialog
                             self.show_upnp_troubleshooting_dialog(router_ip, local_ip)
                             
                         except Exception as ex:
-                            self.upnp_status_label.config(text=f"❌ UPnP: No router found - Check router UPnP settings", foreground='red')
-                            print(f"UPnP gateway detection error: {ex}")
+                            self._set_upnp_status("❌ UPnP: No router found - Check router UPnP settings", 'red')
+                            logger.warning("UPnP gateway detection error: %s", ex)
                         
                 except Exception as e:
-                    self.upnp_status_label.config(text=f"❌ UPnP: Discovery error - {str(e)}", foreground='red')
+                    self._set_upnp_status(f"❌ UPnP: Discovery error - {str(e)}", 'red')
             
-            discovery_thread = threading.Thread(target=discover_worker, daemon=True)
-            discovery_thread.start()
+            self._executor.submit(discover_worker)
             
         except Exception as e:
             self.upnp_status_label.config(text=f"❌ UPnP: Discovery error - {str(e)}", foreground='red')
@@ -740,103 +1069,160 @@ You can assign different processing modes to different directories based on your
     def show_upnp_troubleshooting_dialog(self, router_ip, local_ip):
         """Show UPnP troubleshooting dialog"""
         try:
-            import tkinter as tk
-            from tkinter import messagebox
-            
             # Create troubleshooting message
-            message = f"""UPnP router not found. Here's how to fix it:
-
-1. ENABLE UPnP ON YOUR ROUTER:
-   • Open your router's web interface: http://{router_ip}
-   • Look for 'UPnP' or 'Universal Plug and Play' settings
-   • Enable UPnP if it's disabled
-
-2. COMMON LOCATIONS:
-   • Advanced → UPnP
-   • Network → UPnP  
-   • Firewall → UPnP
-   • Services → UPnP
-
-3. WINDOWS FIREWALL:
-   • Allow 'UPnP Device Host' and 'UPnP Device Discovery'
-   • Enable for both Private and Public networks
-
-4. ALTERNATIVE - MANUAL PORT FORWARDING:
-   • Port: 8765 (TCP)
-   • Internal IP: {local_ip}
-   • External Port: 8765 → Internal Port: 8765
-
-5. REBOOT:
-   • Reboot your router after enabling UPnP
-   • Wait 2-3 minutes and test again
-
-Your router IP: {router_ip}
-Your computer IP: {local_ip}
-
-Note: Enhanced UPnP discovery with multiple methods attempted."""
+            message = UPNP_TROUBLESHOOTING_TEMPLATE.format(router_ip=router_ip, local_ip=local_ip)
             
             # Show dialog in main thread
             self.parent.after(0, lambda: messagebox.showinfo("UPnP Troubleshooting", message))
             
         except Exception as e:
-            print(f"Error showing troubleshooting dialog: {e}")
+            logger.error("Error showing troubleshooting dialog: %s", e)
     
-    def get_default_gateway(self):
+    def _detect_local_ip(self):
+        """Return the local IP used for outbound traffic (no packets are sent)"""
+        import socket
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(("8.8.8.8", 80))
+            return sock.getsockname()[0]
+    
+    def _prefetch_net_info(self):
+        """Look up the local IP and default gateway"""
+        local_ip = self._detect_local_ip()
+        
+        gateway_ip = None
+        if NETIFACES_AVAILABLE:
+            try:
+                gateway_ip = netifaces.gateways()['default'][netifaces.AF_INET][0]
+            except (KeyError, IndexError):
+                gateway_ip = None
+        if not gateway_ip:
+            gateway_ip = self._detect_default_gateway()
+        
+        return local_ip, gateway_ip
+    
+    def get_network_info(self):
+        """Return (local_ip, gateway_ip), re-detecting the gateway only if the local IP changed"""
+        local_ip, gateway_ip = self._net_info_future.result()
+        if self._detect_local_ip() != local_ip:
+            # Called from executor workers, so look up inline instead of waiting on another job
+            local_ip, gateway_ip = self._prefetch_net_info()
+            future = concurrent.futures.Future()
+            future.set_result((local_ip, gateway_ip))
+            self._net_info_future = future
+        return local_ip, gateway_ip
+    
+    def refresh_network_info(self):
+        """Start a new local IP / gateway lookup unless one is already running"""
+        if self._net_info_future.done():
+            self._net_info_future = self._executor.submit(self._prefetch_net_info)
+    
+    def _detect_gateway_winapi(self):
+        """Get the default gateway from the IP routing table via GetBestRoute, or None"""
+        try:
+            import ctypes
+            import socket
+            import struct
+            
+            # MIB_IPFORWARDROW is 14 DWORDs; the next hop is the fourth
+            row = (ctypes.c_uint32 * 14)()
+            if ctypes.windll.iphlpapi.GetBestRoute(0, 0, ctypes.byref(row)) != 0:
+                return None
+            next_hop = row[3]
+            # Addresses are stored in network byte order
+            return socket.inet_ntoa(struct.pack('<I', next_hop)) if next_hop else None
+        except (AttributeError, OSError):
+            return None
+    
+    def _detect_default_gateway(self):
         """Get the default gateway IP address"""
+        gateway_ip = self._detect_gateway_winapi()
+        if gateway_ip:
+            return gateway_ip
+        
         try:
-            import subprocess
-            import re
-            
             # Try Windows route command
-            result = subprocess.run(['route', 'print', '0.0.0.0'], 
-                                  capture_output=True, text=True, timeout=5)
+            result = subprocess.run(['route', 'print', '0.0.0.0'], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, text=True, timeout=5, creationflags=NO_WINDOW)
             
             if result.returncode == 0:
                 # Look for default route (0.0.0.0)
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if '0.0.0.0' in line and 'Gateway' not in line:
-                        # Extract gateway IP from route table
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            gateway_ip = parts[2]
-                            # Validate IP format
-                            if re.match(r'^(\d{1,3}\.){3}\d{1,3}$', gateway_ip):
-                                return gateway_ip
+                for line in result.stdout.splitlines():
+                    if '0.0.0.0' not in line or 'Gateway' in line:
+                        continue
+                    # Extract gateway IP from route table (destination, netmask, gateway, ...)
+                    parts = line.split(None, 3)
+                    if len(parts) >= 3:
+                        gateway_ip = parts[2]
+                        # Validate IP format
+                        if _is_ipv4(gateway_ip):
+                            return gateway_ip
             
             # Fallback: try ipconfig
-            result = subprocess.run(['ipconfig'], capture_output=True, text=True, timeout=5)
+            result = subprocess.run(['ipconfig'], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, text=True, timeout=5, creationflags=NO_WINDOW)
             if result.returncode == 0:
                 # Look for "Default Gateway"
-                lines = result.stdout.split('\n')
-                for line in lines:
+                for line in result.stdout.splitlines():
                     if 'Default Gateway' in line and ':' in line:
-                        gateway_ip = line.split(':')[1].strip()
-                        if gateway_ip and re.match(r'^(\d{1,3}\.){3}\d{1,3}$', gateway_ip):
+                        gateway_ip = line.split(':', 1)[1].strip()
+                        if gateway_ip and _is_ipv4(gateway_ip):
                             return gateway_ip
             
             # Last resort: assume common router IPs
             common_gateways = ['192.168.1.1', '192.168.0.1', '192.168.1.254', '10.0.0.1']
-            for gateway in common_gateways:
-                try:
-                    # Quick connectivity test
-                    import socket
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(1)
-                    result = sock.connect_ex((gateway, 80))
-                    sock.close()
-                    if result == 0:
-                        return gateway
-                except:
-                    continue
+            gateway = self._probe_reachable(common_gateways, 80, 1.0)
+            if gateway:
+                return gateway
             
             # Default fallback
             return '192.168.1.1'
             
         except Exception as e:
-            print(f"Error detecting gateway: {e}")
+            logger.warning("Error detecting gateway: %s", e)
             return '192.168.1.1'
     
+    def _probe_reachable(self, hosts, port, timeout):
+        """Connect to all hosts at once; return the first listed one that accepted within timeout"""
+        import selectors
+        import socket
+        
+        selector = selectors.DefaultSelector()
+        pending = {}
+        try:
+            for host in hosts:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                sock.connect_ex((host, port))
+                selector.register(sock, selectors.EVENT_WRITE, host)
+                pending[host] = sock
+            
+            reachable = set()
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    host = key.data
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        reachable.add(host)
+                    selector.unregister(key.fileobj)
+                    pending.pop(host).close()
+                # Keep the original preference order among hosts that answer
+                for host in hosts:
+                    if host in reachable:
+                        return host
+                    if host in pending:
+                        break
+            
+            return next((host for host in hosts if host in reachable), None)
+        finally:
+            for sock in pending.values():
+                selector.unregister(sock)
+                sock.close()
+            selector.close()
+    
     def create_enhanced_setup_controls_section(self, parent):
         """Create enhanced setup control buttons"""
         controls_frame = ttk.LabelFrame(parent, text="Configuration Controls", padding=15)
@@ -852,7 +1238,8 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
         
         ttk.Button(buttons_frame, text="Save Configuration", command=self.save_enhanced_setup_config).pack(side=tk.LEFT, padx=5)
         ttk.Button(buttons_frame, text="Load Configuration", command=self.load_setup_config).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Test All Configurations", command=self.test_all_configs).pack(side=tk.LEFT, padx=5)
+        self.test_all_button = ttk.Button(buttons_frame, text="Test All Configurations", command=self.test_all_configs)
+        self.test_all_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(buttons_frame, text="Apply & Restart Service", command=self.apply_and_restart).pack(side=tk.LEFT, padx=5)
         
         # Advanced options
@@ -867,18 +1254,13 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
     
     def add_directory_pair(self):
         """Add a new directory pair with processing mode selection"""
-        dialog = DirectoryPairDialog(self.setup_frame, self.processing_modes, self.setup_data['plex_libraries'])
+        dialog = DirectoryPairDialog(self.setup_frame, self.processing_modes, self._plex_library_titles)
         result = dialog.show()
         
         if result:
             # Add to tree
-            self.pairs_tree.insert('', 'end', values=(
-                result['source'],
-                result['target'],
-                self.processing_modes[result['processing_mode']]['name'],
-                result['plex_library'],
-                'Ready'
-            ))
+            iid = self.pairs_tree.insert('', 'end', values=self._pair_row(result, 'Ready'))
+            self._pair_by_iid[iid] = result
             
             # Add to data
             self.setup_data['directory_pairs'].append(result)
@@ -891,32 +1273,24 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             messagebox.showwarning("No Selection", "Please select a directory pair to edit")
             return
         
-        # Get selected item data
-        item = self.pairs_tree.item(selected[0])
-        values = item['values']
-        
-        # Find in data
-        for i, pair in enumerate(self.setup_data['directory_pairs']):
-            if pair['source'] == values[0] and pair['target'] == values[1]:
-                # Edit dialog
-                dialog = DirectoryPairDialog(self.setup_frame, self.processing_modes, 
-                                           self.setup_data['plex_libraries'], pair)
-                result = dialog.show()
-                
-                if result:
-                    # Update tree
-                    self.pairs_tree.item(selected[0], values=(
-                        result['source'],
-                        result['target'],
-                        self.processing_modes[result['processing_mode']]['name'],
-                        result['plex_library'],
-                        'Updated'
-                    ))
-                    
-                    # Update data
-                    self.setup_data['directory_pairs'][i] = result
-                    self.setup_status_label.config(text=f"Updated directory pair: {result['source']}")
-                break
+        # Pair shown in the selected row
+        pair = self._pair_by_iid.get(selected[0])
+        if pair is None:
+            return
+        
+        # Edit dialog
+        dialog = DirectoryPairDialog(self.setup_frame, self.processing_modes, 
+                                   self._plex_library_titles, pair)
+        result = dialog.show()
+        
+        if result:
+            # Update tree
+            self.pairs_tree.item(selected[0], values=self._pair_row(result, 'Updated'))
+            
+            # Update data in place so the row keeps pointing at it
+            pair.clear()
+            pair.update(result)
+            self.setup_status_label.config(text=f"Updated directory pair: {result['source']}")
     
     def remove_directory_pair(self):
         """Remove selected directory pair"""
@@ -926,19 +1300,17 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             return
         
         if messagebox.askyesno("Confirm Remove", "Are you sure you want to remove this directory pair?"):
-            # Get selected item data
-            item = self.pairs_tree.item(selected[0])
-            values = item['values']
-            
             # Remove from data
-            self.setup_data['directory_pairs'] = [
-                pair for pair in self.setup_data['directory_pairs']
-                if not (pair['source'] == values[0] and pair['target'] == values[1])
-            ]
+            pair = self._pair_by_iid.pop(selected[0], None)
+            if pair is not None:
+                self.setup_data['directory_pairs'] = [
+                    p for p in self.setup_data['directory_pairs'] if p is not pair
+                ]
             
             # Remove from tree
+            source = self.pairs_tree.set(selected[0], 'Source Directory')
             self.pairs_tree.delete(selected[0])
-            self.setup_status_label.config(text=f"Removed directory pair: {values[0]}")
+            self.setup_status_label.config(text=f"Removed directory pair: {source}")
     
     def configure_processing_mode(self):
         """Configure processing mode for selected directory pair"""
@@ -947,30 +1319,23 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             messagebox.showwarning("No Selection", "Please select a directory pair to configure")
             return
         
-        # Get selected item data
-        item = self.pairs_tree.item(selected[0])
-        values = item['values']
+        # Pair shown in the selected row
+        pair = self._pair_by_iid.get(selected[0])
+        if pair is None:
+            return
         
-        # Find in data
-        for pair in self.setup_data['directory_pairs']:
-            if pair['source'] == values[0] and pair['target'] == values[1]:
-                # Show processing mode config dialog
-                dialog = ProcessingModeConfigDialog(self.setup_frame, pair['processing_mode'], self.processing_modes)
-                result = dialog.show()
-                
-                if result:
-                    pair['processing_mode'] = result
-                    # Update tree
-                    self.pairs_tree.item(selected[0], values=(
-                        values[0], values[1], 
-                        self.processing_modes[result]['name'],
-                        values[3], 'Updated'
-                    ))
-                    self.setup_status_label.config(text=f"Updated processing mode for: {values[0]}")
-                break
-    
-    def save_enhanced_setup_config(self):
-        """Save enhanced configuration with processing modes"""
+        # Show processing mode config dialog
+        dialog = ProcessingModeConfigDialog(self.setup_frame, pair['processing_mode'], self.processing_modes)
+        result = dialog.show()
+        
+        if result:
+            pair['processing_mode'] = result
+            # Update tree
+            self.pairs_tree.item(selected[0], values=self._pair_row(pair, 'Updated'))
+            self.setup_status_label.config(text=f"Updated processing mode for: {pair['source']}")
+    
+    def save_enhanced_setup_config(self, on_saved=None):
+        """Save enhanced configuration with processing modes; on_saved runs after the files are written"""
         try:
             # Create enhanced config
             config = {
@@ -991,7 +1356,7 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                     'rar2fs': {
                         'executable': self.rar2fs_exe_var.get(),
                         'mount_base': self.rar2fs_mount_base_var.get(),
-                        'mount_options': self.rar2fs_options_text.get('1.0', tk.END).strip().split('\n'),
+                        'mount_options': self._get_rar2fs_mount_options(),
                         'timeout': int(self.rar2fs_timeout_var.get()),
                         'unmount_timeout': int(self.rar2fs_unmount_timeout_var.get()),
                         'auto_cleanup': self.rar2fs_auto_cleanup_var.get(),
@@ -1009,107 +1374,175 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 },
                 'upnp': {
                     'enabled': self.upnp_enabled_var.get(),
-                    'timeout': int(self.upnp_timeout_var.get()),
-                    'retry_count': int(self.upnp_retry_var.get()),
-                    'lease_duration': int(self.upnp_lease_var.get())
+                    'timeout': self.upnp_timeout_var.get(),
+                    'retry_count': self.upnp_retry_var.get(),
+                    'lease_duration': self.upnp_lease_var.get()
                 }
             }
             
-            # Save to file
-            setup_config_path = self.script_dir / 'enhanced_setup_config.json'
-            with open(setup_config_path, 'w') as f:
-                json.dump(config, f, indent=2)
-            
-            # Also update main config.yaml
-            self.update_main_config_with_modes()
-            
-            self.setup_status_label.config(text="Configuration saved successfully!", foreground='green')
+            # Everything is read from the widgets here; the files are written in the background.
+            # The copy detaches directory_pairs from setup_data, which the UI keeps editing.
+            config = copy.deepcopy(config)
+            main_updates = self._collect_main_config_updates(config)
+            omdb_api_key = config['omdb']['api_key']
             
         except Exception as e:
             self.setup_status_label.config(text=f"Error saving configuration: {e}", foreground='red')
             messagebox.showerror("Save Error", f"Failed to save configuration: {e}")
+            return
+        
+        self.setup_status_label.config(text="Saving configuration...", foreground='blue')
+        future = self._executor.submit(self._write_setup_files, config, main_updates, omdb_api_key)
+        future.add_done_callback(lambda f: self.parent.after(0, self._on_setup_saved, f, on_saved))
     
-    def update_main_config_with_modes(self):
-        """Update main config.yaml with processing modes"""
+    def _on_setup_saved(self, future, on_saved):
+        """Report the result of a background save on the Tk thread"""
+        error = future.exception()
+        if error is not None:
+            self.setup_status_label.config(text=f"Error saving configuration: {error}", foreground='red')
+            messagebox.showerror("Save Error", f"Failed to save configuration: {error}")
+            return
+        
+        self.setup_status_label.config(text="Configuration saved successfully!", foreground='green')
+        if on_saved:
+            on_saved()
+    
+    def _write_setup_files(self, config, main_updates, omdb_api_key):
+        """Write enhanced_setup_config.json, config.yaml and ftp_config.json"""
+        self._save_config_file(self.script_dir / 'enhanced_setup_config.json', config)
+        
+        # Also update main config.yaml
         try:
             config_path = self.script_dir / 'config.yaml'
             
             # Load existing config
             if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f) or {}
+                main_config = self._load_config_file(config_path) or {}
             else:
-                config = {}
+                main_config = {}
             
-            # Update with processing mode settings
-            config['options'] = config.get('options', {})
-            config['options']['processing_mode'] = self.global_mode_var.get()
-            
-            # Add UPnP configuration
-            config['upnp'] = {
-                'enabled': self.upnp_enabled_var.get(),
-                'timeout': int(self.upnp_timeout_var.get()),
-                'retry_count': int(self.upnp_retry_var.get()),
-                'lease_duration': int(self.upnp_lease_var.get())
-            }
-            
-            # Add mode-specific configurations
-            if self.global_mode_var.get() == 'python_vfs':
-                config['python_vfs'] = {
-                    'port_range': [int(self.vfs_port_start_var.get()), int(self.vfs_port_end_var.get())],
-                    'mount_base': self.vfs_mount_base_var.get()
-                }
-            elif self.global_mode_var.get() == 'rar2fs':
-                config['rar2fs'] = {
-                    'enabled': True,
-                    'executable': self.rar2fs_exe_var.get(),
-                    'mount_base': self.rar2fs_mount_base_var.get(),
-                    'mount_options': self.rar2fs_options_text.get('1.0', tk.END).strip().split('\n'),
-                    'timeout': int(self.rar2fs_timeout_var.get()),
-                    'unmount_timeout': int(self.rar2fs_unmount_timeout_var.get()),
-                    'auto_cleanup': self.rar2fs_auto_cleanup_var.get(),
-                    'verify_mounts': self.rar2fs_verify_mounts_var.get()
-                }
+            options = main_updates.pop('options')
+            main_config['options'] = main_config.get('options', {})
+            main_config['options'].update(options)
+            main_config.update(main_updates)
             
             # Save updated config
-            with open(config_path, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            self._save_config_file(config_path, main_config)
             
         except Exception as e:
-            print(f"Error updating main config: {e}")
+            logger.error("Error updating main config: %s", e)
         
         # Also update FTP config with OMDB API key if it exists
         try:
             ftp_config_path = self.script_dir / 'ftp_config.json'
             if ftp_config_path.exists():
-                with open(ftp_config_path, 'r') as f:
-                    ftp_config = json.load(f)
+                ftp_config = self._load_config_file(ftp_config_path)
                 
                 # Update OMDB API key in FTP config
                 if 'imdb' not in ftp_config:
                     ftp_config['imdb'] = {}
                 
-                ftp_config['imdb']['api_key'] = self.omdb_api_key_var.get()
+                ftp_config['imdb']['api_key'] = omdb_api_key
                 
                 # Save updated FTP config
-                with open(ftp_config_path, 'w') as f:
-                    json.dump(ftp_config, f, indent=2)
+                self._save_config_file(ftp_config_path, ftp_config)
         except Exception as e:
-            print(f"Error updating FTP config: {e}")
+            logger.error("Error updating FTP config: %s", e)
+    
+    def _collect_main_config_updates(self, config):
+        """Derive the settings merged into config.yaml from the enhanced setup config"""
+        mode = config['global_processing_mode']
+        updates = {
+            'options': {'processing_mode': mode},
+            
+            # Add UPnP configuration
+            'upnp': dict(config['upnp'])
+        }
+        
+        # Add mode-specific configurations
+        if mode == 'python_vfs':
+            updates['python_vfs'] = dict(config['processing_modes']['python_vfs'])
+        elif mode == 'rar2fs':
+            updates['rar2fs'] = {'enabled': True, **config['processing_modes']['rar2fs']}
+        return updates
+    
+    @classmethod
+    def _load_config_file(cls, path):
+        """Parse a JSON or YAML config file, reusing the previous parse if it is unchanged"""
+        # Nanosecond mtimes, so quick successive writes are not mistaken for the cached parse
+        mtime = path.stat().st_mtime_ns
+        cached = cls._CONFIG_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            if path.suffix in ('.yaml', '.yml'):
+                data = cls._load_yaml_file(path, mtime)
+            else:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            cached = (mtime, data)
+            cls._CONFIG_CACHE[path] = cached
+        # Callers mutate the result, so never hand out the cached object
+        return copy.deepcopy(cached[1])
+    
+    @classmethod
+    def _save_config_file(cls, path, data):
+        """Write a JSON or YAML config file atomically and remember it as the cached parse"""
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            if path.suffix in ('.yaml', '.yml'):
+                import yaml
+                dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+                yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
+            else:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+        cls._CONFIG_CACHE[path] = (path.stat().st_mtime_ns, copy.deepcopy(data))
+    
+    @staticmethod
+    def _load_yaml_file(path, mtime):
+        """Parse a YAML file, going through a cached msgpack copy when msgpack is installed"""
+        # Keyed by the resolved path so configs from different checkouts do not collide
+        key = hashlib.sha256(str(path.resolve()).encode('utf-8')).hexdigest()[:16]
+        packed_path = CACHE_DIR / f"{key}-{path.name}.msgpack"
+        if MSGPACK_AVAILABLE:
+            import msgpack
+            try:
+                if packed_path.stat().st_mtime_ns >= mtime:
+                    return msgpack.unpackb(packed_path.read_bytes(), raw=False, strict_map_key=False)
+            except (OSError, ValueError, msgpack.UnpackException):
+                pass
+        
+        import yaml
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        with open(path, 'r') as f:
+            data = yaml.load(f, Loader=loader)
+        
+        if MSGPACK_AVAILABLE:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                packed_path.write_bytes(msgpack.packb(data, use_bin_type=True))
+            except (OSError, TypeError, ValueError) as e:
+                # Values msgpack cannot represent (e.g. YAML dates) just skip the copy
+                logger.debug("Could not write %s: %s", packed_path.name, e)
+        return data
     
     def load_setup_config(self):
         """Load setup configuration"""
         try:
             setup_config_path = self.script_dir / 'enhanced_setup_config.json'
             if setup_config_path.exists():
-                with open(setup_config_path, 'r') as f:
-                    config = json.load(f)
+                config = self._load_config_file(setup_config_path)
                 
                 # Load plex settings
                 plex_config = config.get('plex', {})
                 self.plex_host_var.set(plex_config.get('host', ''))
                 self.plex_token_var.set(plex_config.get('token', ''))
                 
+                # Show the libraries of the last connection test without asking the server again
+                libraries = self._load_probe_cache()
+                if libraries:
+                    self._set_plex_libraries(libraries)
+                
                 # Load OMDB settings
                 omdb_config = config.get('omdb', {})
                 self.omdb_api_key_var.set(omdb_config.get('api_key', ''))
@@ -1135,8 +1568,7 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 self.rar2fs_exe_var.set(rar2fs_config.get('executable', 'C:/Program Files/PlexRarBridge/rar2fs/bin/rar2fs.exe'))
                 self.rar2fs_mount_base_var.set(rar2fs_config.get('mount_base', 'C:/PlexRarBridge/rar2fs_mounts'))
                 mount_options = rar2fs_config.get('mount_options', ['uid=-1', 'gid=-1', 'allow_other'])
-                self.rar2fs_options_text.delete('1.0', tk.END)
-                self.rar2fs_options_text.insert(tk.END, '\n'.join(mount_options))
+                self._set_rar2fs_mount_options(mount_options)
                 self.rar2fs_timeout_var.set(str(rar2fs_config.get('timeout', 60)))
                 self.rar2fs_unmount_timeout_var.set(str(rar2fs_config.get('unmount_timeout', 30)))
                 self.rar2fs_auto_cleanup_var.set(rar2fs_config.get('auto_cleanup', True))
@@ -1156,9 +1588,9 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 # UPnP configuration
                 upnp_config = config.get('upnp', {})
                 self.upnp_enabled_var.set(upnp_config.get('enabled', True))
-                self.upnp_timeout_var.set(str(upnp_config.get('timeout', 10)))
-                self.upnp_retry_var.set(str(upnp_config.get('retry_count', 3)))
-                self.upnp_lease_var.set(str(upnp_config.get('lease_duration', 3600)))
+                self.upnp_timeout_var.set(int(upnp_config.get('timeout', 10)))
+                self.upnp_retry_var.set(int(upnp_config.get('retry_count', 3)))
+                self.upnp_lease_var.set(int(upnp_config.get('lease_duration', 3600)))
                 
                 # Update UPnP settings visibility
                 self.toggle_upnp_settings()
@@ -1173,91 +1605,189 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
     
     def refresh_pairs_tree(self):
         """Refresh the directory pairs tree"""
-        # Clear existing items
-        for item in self.pairs_tree.get_children():
-            self.pairs_tree.delete(item)
-        
-        # Add pairs from data
-        for pair in self.setup_data['directory_pairs']:
-            self.pairs_tree.insert('', 'end', values=(
-                pair['source'],
-                pair['target'],
-                self.processing_modes[pair['processing_mode']]['name'],
-                pair['plex_library'],
-                'Ready'
-            ))
-    
-    def test_all_configs(self):
-        """Test all processing mode configurations"""
-        self.setup_status_label.config(text="Testing all configurations...", foreground='blue')
+        # Clear existing items in one call
+        self.pairs_tree.delete(*self.pairs_tree.get_children())
+        self._pair_by_iid.clear()
+        
+        # Build all row values first so the insert loop is tight
+        rows = [(pair, self._pair_row(pair, 'Ready')) for pair in self.setup_data['directory_pairs']]
         
-        # Test Python VFS
-        self.test_python_vfs()
+        # Drop any batches still pending from a previous refresh
+        if self._pairs_render_job:
+            self.parent.after_cancel(self._pairs_render_job)
+            self._pairs_render_job = None
         
-        # Test rar2fs
-        self.test_rar2fs()
+        # Unmap the tree while inserting the first screenful so Tk runs one layout
+        # pass instead of one per row; the rest is appended in idle-time batches
+        self.pairs_tree.pack_forget()
+        try:
+            for pair, values in rows[:PAIRS_TREE_BATCH]:
+                self._pair_by_iid[self.pairs_tree.insert('', 'end', values=values)] = pair
+        finally:
+            self.pairs_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.pairs_scroll)
+        
+        if len(rows) > PAIRS_TREE_BATCH:
+            self._pairs_render_job = self.parent.after(0, self._insert_pairs_batch, rows, PAIRS_TREE_BATCH)
+    
+    def _pair_row(self, pair, status):
+        """Return the pairs tree values for a directory pair"""
+        return (
+            pair['source'],
+            pair['target'],
+            self._mode_name[pair['processing_mode']],
+            pair['plex_library'],
+            status
+        )
+    
+    def _insert_pairs_batch(self, rows, start):
+        """Append the next batch of rows to the directory pairs tree"""
+        end = start + PAIRS_TREE_BATCH
+        for pair, values in rows[start:end]:
+            self._pair_by_iid[self.pairs_tree.insert('', 'end', values=values)] = pair
         
-        # Test extraction
-        self.test_extraction()
+        if end < len(rows):
+            self._pairs_render_job = self.parent.after(0, self._insert_pairs_batch, rows, end)
+        else:
+            self._pairs_render_job = None
+    
+    def test_all_configs(self, include_rar2fs_status=False):
+        """Test all processing mode configurations in the background, optionally with the rar2fs mounts and service"""
+        self.setup_status_label.config(text="Testing all configurations...", foreground='blue')
+        self.test_all_button.config(state='disabled')
+        
+        # Read the settings here; the probes themselves run off the Tk thread.
+        # Each probe is paired with the Tk-thread callback that shows its result.
+        probes = [
+            (functools.partial(self._show_probe_status, 'vfs_status_label'),
+             self._probe_python_vfs, (self.vfs_port_start_var.get(), self.vfs_mount_base_var.get())),
+            (functools.partial(self._show_probe_status, 'rar2fs_status_label'),
+             self._probe_rar2fs, (self.rar2fs_exe_var.get(),)),
+            (functools.partial(self._show_probe_status, 'extraction_status_label'),
+             self._probe_extraction, (self.extraction_work_var.get(),)),
+        ]
+        if include_rar2fs_status:
+            probes += [
+                (self._set_mounts_text, self._probe_rar2fs_mounts, (self.rar2fs_mount_base_var.get(),)),
+                (functools.partial(self._show_probe_status, 'rar2fs_service_status_label'),
+                 self._probe_winfsp_service, ()),
+            ]
         
+        def test_worker():
+            try:
+                # The probes are independent, so run them side by side and report each as it finishes
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(probes)) as pool:
+                    futures = {pool.submit(probe, *args): show for show, probe, args in probes}
+                    for future in concurrent.futures.as_completed(futures):
+                        self.parent.after(0, futures[future], future.result())
+            finally:
+                self.parent.after(0, self._on_all_configs_tested)
+        
+        self._executor.submit(test_worker)
+    
+    def _show_probe_status(self, name, result):
+        """Show a (status text, color) probe result in a status label"""
+        self._set_status(name, *result)
+    
+    def _on_all_configs_tested(self):
+        """Re-enable testing once all configuration probes have reported"""
+        self.test_all_button.config(state='normal')
         self.setup_status_label.config(text="Configuration tests completed", foreground='green')
     
-    def test_python_vfs(self):
-        """Test Python VFS configuration"""
+    @staticmethod
+    def _probe_python_vfs(port, mount_base):
+        """Check the Python VFS port and mount base; return (status text, color)"""
         try:
             # Test port availability
             import socket
-            port = int(self.vfs_port_start_var.get())
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('localhost', port))
+                s.bind(('localhost', int(port)))
             
             # Test mount base directory
-            mount_base = Path(self.vfs_mount_base_var.get())
-            mount_base.mkdir(parents=True, exist_ok=True)
+            Path(mount_base).mkdir(parents=True, exist_ok=True)
             
-            self.vfs_status_label.config(text="✅ Python VFS: Configuration OK", foreground='green')
+            return "✅ Python VFS: Configuration OK", 'green'
             
         except Exception as e:
-            self.vfs_status_label.config(text=f"❌ Python VFS: {e}", foreground='red')
-    
-    def test_rar2fs(self):
-        """Test rar2fs configuration"""
+            return f"❌ Python VFS: {e}", 'red'
+    
+    def _cached_probe(self, executable, probe):
+        """Run probe() once per executable build, keyed by its path and modification time"""
+        key = (str(executable), os.stat(executable).st_mtime)
+        result = self._probe_cache.get(key)
+        if result is None:
+            result = probe()
+            self._probe_cache[key] = result
+        return result
+    
+    def _probe_rar2fs(self, executable):
+        """Check that the rar2fs executable runs; return (status text, color)"""
         try:
-            rar2fs_exe = Path(self.rar2fs_exe_var.get())
+            rar2fs_exe = Path(executable)
             
             if not rar2fs_exe.exists():
-                self.rar2fs_status_label.config(text="❌ rar2fs: Executable not found", foreground='red')
-                return
+                return "❌ rar2fs: Executable not found", 'red'
             
-            # Test executable
-            result = subprocess.run([str(rar2fs_exe), '--help'], 
-                                  capture_output=True, text=True, timeout=10)
+            # Test executable (once per build of it)
+            returncode = self._cached_probe(rar2fs_exe, lambda: subprocess.run(
+                [str(rar2fs_exe), '--help'], stdin=subprocess.DEVNULL,
+                capture_output=True, text=True, timeout=10, creationflags=NO_WINDOW).returncode)
             
-            if result.returncode == 0:
-                self.rar2fs_status_label.config(text="✅ rar2fs: Configuration OK", foreground='green')
-            else:
-                self.rar2fs_status_label.config(text="❌ rar2fs: Executable test failed", foreground='red')
+            if returncode == 0:
+                return "✅ rar2fs: Configuration OK", 'green'
+            return "❌ rar2fs: Executable test failed", 'red'
                 
         except Exception as e:
-            self.rar2fs_status_label.config(text=f"❌ rar2fs: {e}", foreground='red')
+            return f"❌ rar2fs: {e}", 'red'
     
-    def test_extraction(self):
-        """Test extraction configuration"""
+    def _probe_extraction(self, work_dir):
+        """Check the extraction work directory and UnRAR; return (status text, color)"""
+        import shutil
+        
         try:
             # Test work directory
-            work_dir = Path(self.extraction_work_var.get())
-            work_dir.mkdir(parents=True, exist_ok=True)
+            Path(work_dir).mkdir(parents=True, exist_ok=True)
             
-            # Test UnRAR
-            result = subprocess.run(['unrar'], capture_output=True, text=True, timeout=5)
+            # Test UnRAR (once per build of it)
+            unrar = shutil.which('unrar')
+            if not unrar:
+                return "❌ Extraction: UnRAR not found", 'red'
             
-            if "UNRAR" in result.stderr.upper():
-                self.extraction_status_label.config(text="✅ Extraction: Configuration OK", foreground='green')
-            else:
-                self.extraction_status_label.config(text="❌ Extraction: UnRAR not found", foreground='red')
+            responds = self._cached_probe(unrar, lambda: "UNRAR" in subprocess.run(
+                [unrar], stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                timeout=5, creationflags=NO_WINDOW).stderr.upper())
+            
+            if responds:
+                return "✅ Extraction: Configuration OK", 'green'
+            return "❌ Extraction: UnRAR not found", 'red'
                 
         except Exception as e:
-            self.extraction_status_label.config(text=f"❌ Extraction: {e}", foreground='red')
+            return f"❌ Extraction: {e}", 'red'
+    
+    def test_python_vfs(self):
+        """Test Python VFS configuration"""
+        text, color = self._probe_python_vfs(self.vfs_port_start_var.get(), self.vfs_mount_base_var.get())
+        self._set_status('vfs_status_label', text, color)
+    
+    def test_rar2fs(self):
+        """Test rar2fs configuration"""
+        text, color = self._probe_rar2fs(self.rar2fs_exe_var.get())
+        self._set_status('rar2fs_status_label', text, color)
+    
+    def test_extraction(self):
+        """Test extraction configuration"""
+        text, color = self._probe_extraction(self.extraction_work_var.get())
+        self._set_status('extraction_status_label', text, color)
+    
+    def _get_setup_module(self):
+        """Import setup.py (for the Plex discovery functions) once and keep it"""
+        if self._setup_mod is None:
+            import sys
+            script_dir = str(self.script_dir)
+            if script_dir not in sys.path:
+                sys.path.append(script_dir)
+            import setup
+            self._setup_mod = setup
+        return self._setup_mod
     
     def auto_detect_plex(self):
         """Auto-detect Plex server"""
@@ -1267,15 +1797,19 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.setup_status_label.pack(pady=5)
         
         self.setup_status_label.config(text="Detecting Plex server...", foreground='blue')
-        self.setup_frame.update()
         
+        # Discovery runs on the executor; the result is applied back on the Tk thread
+        future = self._executor.submit(self._run_plex_discovery, 'discover_plex_server')
+        future.add_done_callback(lambda f: self.parent.after(0, self._on_plex_server_detected, f))
+    
+    def _run_plex_discovery(self, name):
+        """Call one of the setup module's Plex discovery functions"""
+        return getattr(self._get_setup_module(), name)()
+    
+    def _on_plex_server_detected(self, future):
+        """Apply a finished Plex server discovery"""
         try:
-            # Import the discovery functions from setup.py
-            import sys
-            sys.path.append(str(self.script_dir))
-            from setup import discover_plex_server
-            
-            host = discover_plex_server()
+            host = future.result()
             if host:
                 self.plex_host_var.set(host)
                 self.setup_status_label.config(text=f"Found Plex server: {host}", foreground='green')
@@ -1293,24 +1827,26 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.setup_status_label.pack(pady=5)
         
         self.setup_status_label.config(text="Detecting Plex token...", foreground='blue')
-        self.setup_frame.update()
         
+        future = self._executor.submit(self._run_plex_discovery, 'discover_plex_token')
+        future.add_done_callback(lambda f: self.parent.after(0, self._on_plex_token_detected, f))
+    
+    def _on_plex_token_detected(self, future):
+        """Apply a finished Plex token discovery"""
         try:
-            from setup import discover_plex_token
-            
-            token = discover_plex_token()
+            token = future.result()
             if token:
                 self.plex_token_var.set(token)
                 self.setup_status_label.config(text="Plex token detected successfully", foreground='green')
                 # Auto-test connection
-                self.test_plex_connection()
+                self.test_plex_connection(refresh=False)
             else:
                 self.setup_status_label.config(text="Could not auto-detect Plex token", foreground='orange')
         except Exception as e:
             self.setup_status_label.config(text=f"Error detecting token: {e}", foreground='red')
     
-    def test_plex_connection(self):
-        """Test Plex connection and load libraries"""
+    def test_plex_connection(self, refresh=True):
+        """Test Plex connection and load libraries; refresh=False may reuse a recent response"""
         host = self.plex_host_var.get().strip()
         token = self.plex_token_var.get().strip()
         
@@ -1318,50 +1854,90 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.plex_status_label.config(text="Please enter host and token", foreground='red')
             return
         
+        # An explicit test always asks the server again, bypassing both response caches
+        if refresh:
+            self._plex_sections_cache.pop((host, token), None)
+        
         if not hasattr(self, 'setup_status_label'):
             self.setup_status_label = tk.Label(self.setup_frame, text="Testing Plex connection...")
             self.setup_status_label.pack(pady=5)
         
         self.setup_status_label.config(text="Testing Plex connection...", foreground='blue')
-        self.setup_frame.update()
         
+        # The request runs on the executor; results are applied back on the Tk thread
+        future = self._executor.submit(self._fetch_plex_sections, host, token, refresh)
+        future.add_done_callback(lambda f: self.parent.after(0, self._on_plex_sections, f, host, token))
+    
+    def _fetch_plex_sections(self, host, token, refresh=False):
+        """Request and parse the Plex library sections, reusing a response younger than PLEX_SECTIONS_TTL"""
+        cached = self._plex_sections_cache.get((host, token))
+        if cached and not refresh and time.monotonic() - cached[0] < PLEX_SECTIONS_TTL:
+            return cached[1]
+        
+        url = f"{host.rstrip('/')}/library/sections"
+        params = {'X-Plex-Token': token}
+        
+        response = self._http_get_retry(url, params, timeout=10, refresh=refresh)
+        response.raise_for_status()
+        
+        # Parse libraries, with libxml2 when lxml is installed
         try:
-            # Test connection
-            import requests
-            url = f"{host.rstrip('/')}/library/sections"
-            params = {'X-Plex-Token': token}
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            # Parse libraries
+            from lxml import etree as ET
+        except ImportError:
             import xml.etree.ElementTree as ET
-            root = ET.fromstring(response.content)
-            
-            libraries = []
-            self.libraries_listbox.delete(0, tk.END)
-            
-            for directory in root.findall('.//Directory'):
-                lib_key = directory.get('key')
-                lib_title = directory.get('title')
-                lib_type = directory.get('type')
-                
-                if lib_key and lib_title:
-                    library_info = {
-                        'key': lib_key,
-                        'title': lib_title,
-                        'type': lib_type
-                    }
-                    libraries.append(library_info)
-                    
-                    # Add to listbox with type indicator
-                    type_icon = "📽️" if lib_type == "movie" else "📺" if lib_type == "show" else "📁"
-                    display_text = f"{type_icon} {lib_title} (Key: {lib_key})"
-                    self.libraries_listbox.insert(tk.END, display_text)
+        root = ET.fromstring(response.content)
+        self._plex_sections_cache[(host, token)] = (time.monotonic(), root)
+        return root
+    
+    def _http_get_retry(self, url, params, timeout, refresh=False):
+        """GET url, retrying transient failures with exponential backoff (call off the Tk thread)"""
+        import requests
+        
+        session = self.get_http_session()
+        # no-cache makes requests-cache skip its stored response for this request only,
+        # leaving the shared session's cache on for other workers
+        headers = {'Cache-Control': 'no-cache'} if refresh else None
+        
+        for attempt in range(PLEX_RETRY_ATTEMPTS):
+            last_attempt = attempt == PLEX_RETRY_ATTEMPTS - 1
+            delay = min(PLEX_RETRY_MAX_DELAY, 0.25 * 2 ** attempt) + random.uniform(0, 0.25)
+            try:
+                response = session.get(url, params=params, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt:
+                    raise
+                logger.debug("Plex request failed (%s), retrying in %.2fs", e, delay)
+            else:
+                if response.status_code < 500 or last_attempt:
+                    return response
+                # Honor the server's Retry-After (in seconds) when it sends one
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = min(PLEX_RETRY_MAX_DELAY, int(retry_after))
+                logger.debug("Plex returned %s, retrying in %.2fs", response.status_code, delay)
+            time.sleep(delay)
+    
+    def _on_plex_sections(self, future, host, token):
+        """Fill the libraries list from a finished Plex sections request"""
+        try:
+            root = future.result()
+            
+            # Sections are direct children of <MediaContainer>; search deeper only if the layout differs
+            directories = root.findall('Directory') or root.findall('.//Directory')
+            libraries = [
+                {
+                    'key': directory.get('key'),
+                    'title': directory.get('title'),
+                    'type': directory.get('type')
+                }
+                for directory in directories
+                if directory.get('key') and directory.get('title')
+            ]
             
-            self.setup_data['plex_libraries'] = libraries
+            self._set_plex_libraries(libraries)
             self.setup_data['plex_host'] = host
             self.setup_data['plex_token'] = token
+            self._executor.submit(self._save_probe_cache, host, token, libraries)
             
             self.plex_status_label.config(text=f"✅ Connected - Found {len(libraries)} libraries", foreground='green')
             self.setup_status_label.config(text=f"Connected to Plex - {len(libraries)} libraries available", foreground='green')
@@ -1370,32 +1946,122 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.plex_status_label.config(text=f"❌ Connection failed: {e}", foreground='red')
             self.setup_status_label.config(text=f"Plex connection failed: {e}", foreground='red')
     
+    def _set_plex_libraries(self, libraries):
+        """Store and list the Plex libraries, and the titles offered for directory pairs"""
+        # Fill the listbox in one call, with a type indicator per library
+        items = [
+            f"{LIBRARY_TYPE_ICONS.get(lib.get('type'), '📁')} {lib.get('title')} (Key: {lib.get('key')})"
+            for lib in libraries
+            if isinstance(lib, dict)
+        ]
+        self.libraries_listbox.delete(0, tk.END)
+        if items:
+            self.libraries_listbox.insert(tk.END, *items)
+        
+        self.setup_data['plex_libraries'] = libraries
+        self._plex_library_titles = self._normalize_libraries(libraries)
+    
+    @staticmethod
+    def _probe_cache_server_id(host, token):
+        """Identify a Plex server and token in the probe cache without storing the token itself"""
+        return hashlib.sha256(f"{host}\n{token}".encode('utf-8')).hexdigest()
+    
+    def _load_probe_cache(self):
+        """Return the cached libraries of the configured Plex server, or None if missing or stale"""
+        try:
+            with open(CACHE_DIR / PROBE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        host = self.plex_host_var.get().strip()
+        token = self.plex_token_var.get().strip()
+        if not isinstance(cache, dict) or cache.get('server') != self._probe_cache_server_id(host, token):
+            return None
+        if time.time() - cache.get('detected_at', 0) >= PROBE_CACHE_TTL:
+            return None
+        return cache.get('libraries')
+    
+    def _save_probe_cache(self, host, token, libraries):
+        """Remember the libraries of a successful Plex connection test across restarts"""
+        cache = {
+            'server': self._probe_cache_server_id(host, token),
+            'libraries': libraries,
+            'detected_at': time.time()
+        }
+        cache_path = CACHE_DIR / PROBE_CACHE_FILE
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning("Could not write Plex probe cache: %s", e)
+    
+    @staticmethod
+    def _normalize_libraries(libraries):
+        """Return the display title of each library, skipping malformed entries"""
+        titles = []
+        for lib in libraries:
+            if not isinstance(lib, dict):
+                logger.warning("Ignoring malformed Plex library entry: %r", lib)
+                continue
+            # Support both 'title' and 'name' fields for compatibility; 'name' is only looked up when needed
+            titles.append(lib.get('title') or lib.get('name') or 'Unknown Library')
+        return tuple(titles)
+    
+    def get_http_session(self):
+        """Return the shared HTTP session, caching GET responses when requests-cache is installed"""
+        if self._http is None:
+            if REQUESTS_CACHE_AVAILABLE:
+                import requests_cache
+                # Entries expire after 60s; stale entries with an ETag/Last-Modified are
+                # revalidated with a conditional request. The token is a query parameter,
+                # so it is part of the cache key; the cache stays in memory so the token
+                # is never written to disk.
+                self._http = requests_cache.CachedSession(
+                    backend='memory',
+                    expire_after=60,
+                    allowable_methods=('GET',)
+                )
+            else:
+                import requests
+                self._http = requests.Session()
+            
+            # Keep connections to the Plex server alive between requests
+            from requests.adapters import HTTPAdapter
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+            self._http.mount('http://', adapter)
+            self._http.mount('https://', adapter)
+        return self._http
+    
+    def _on_setup_frame_destroyed(self, event):
+        """Release the pooled HTTP connections, variable trace and idle workers when the panel goes away"""
+        if event.widget is not self.setup_frame:
+            return
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        # The variables are created once and outlive any redraw; only the trace needs releasing
+        self.global_mode_var.trace_remove('write', self._global_mode_trace)
+        # Running jobs finish on their own; a running install is left to complete
+        self._executor.shutdown(wait=False)
+        self._install_executor.shutdown(wait=False)
+    
     def install_rar2fs(self):
         """Install rar2fs using the enhanced installer with admin privilege checking"""
         import ctypes
         import sys
         import os
         
-        # Check if running as administrator
-        def is_admin():
-            try:
-                return ctypes.windll.shell32.IsUserAnAdmin()
-            except:
-                return False
-        
-        if not is_admin():
-            response = messagebox.askyesno(
-                "Administrator Required", 
-                "rar2fs installation requires administrator privileges.\n\n"
-                "The installation process will:\n"
-                "• Install WinFSP with complete components\n"
-                "• Install Cygwin with development tools\n"
-                "• Download and compile UnRAR library\n"
-                "• Download and compile rar2fs from source\n"
-                "• Create Windows integration wrapper\n\n"
-                "This process may take 15-30 minutes.\n\n"
-                "Would you like to restart as administrator?"
-            )
+        if self._install_future is not None and not self._install_future.done():
+            messagebox.showinfo("Install In Progress", "rar2fs installation is already running.")
+            return
+        
+        # Check if running as administrator (detected once at import)
+        if not IS_ADMIN:
+            response = messagebox.askyesno("Administrator Required", RAR2FS_ADMIN_REQUIRED_MESSAGE)
             
             if response:
                 try:
@@ -1421,144 +2087,113 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             return
         
         # Running as admin, proceed with installation
+        self._schedule_status('rar2fs_status_label', "🔄 Starting rar2fs installation...", 'blue')
+        
+        # Enhanced installer, located once at module load
+        installer_path = RAR2FS_INSTALLER_PATH
+        if installer_path is None:
+            self._schedule_status('rar2fs_status_label', "❌ Enhanced installer not found", 'red')
+            messagebox.showerror("Installer Error", RAR2FS_INSTALLER_MISSING_MESSAGE)
+            return
+        
+        # Show installation warning
+        response = messagebox.askyesno("rar2fs Installation", RAR2FS_INSTALL_CONFIRM_MESSAGE)
+        
+        if not response:
+            self._schedule_status('rar2fs_status_label', "❌ Installation cancelled", 'orange')
+            return
+        
+        self._schedule_status('rar2fs_status_label', "🔄 Running enhanced installer...", 'blue')
+        
+        # The worker only runs the installer; all widget updates go back through after()
         def install_in_thread():
             try:
-                self.rar2fs_status_label.config(text="🔄 Starting rar2fs installation...", foreground='blue')
-                self.parent.update()
-                
-                # Check if enhanced installer exists
-                installer_path = os.path.join(os.path.dirname(__file__), "advanced_rar2fs_installer.py")
-                if not os.path.exists(installer_path):
-                    # Try installation directory
-                    installer_path = r"C:\Program Files\PlexRarBridge\advanced_rar2fs_installer.py"
-                    if not os.path.exists(installer_path):
-                        raise FileNotFoundError("Enhanced rar2fs installer not found")
-                
-                # Show installation warning
-                response = messagebox.askyesno(
-                    "rar2fs Installation",
-                    "Enhanced rar2fs installation will:\n\n"
-                    "⏱️ Time: 15-30 minutes\n"
-                    "💾 Space: 2-4 GB additional disk space\n"
-                    "🌐 Network: Downloads required components\n\n"
-                    "This installs a complete rar2fs system with:\n"
-                    "• WinFSP with all components\n"
-                    "• Cygwin development environment\n"
-                    "• Latest rar2fs compiled from source\n"
-                    "• Windows wrapper for easy usage\n\n"
-                    "Continue with installation?"
-                )
-                
-                if not response:
-                    self.rar2fs_status_label.config(text="❌ Installation cancelled", foreground='orange')
-                    return
-                
-                self.rar2fs_status_label.config(text="🔄 Running enhanced installer...", foreground='blue')
-                self.parent.update()
-                
-                # Use the enhanced installer directly
-                import subprocess
-                
-                try:
-                    # Run the enhanced installer
-                    result = subprocess.run([
-                        sys.executable, 
-                        installer_path
-                    ], 
-                    cwd=os.path.dirname(installer_path),
-                    capture_output=True, 
-                    text=True, 
-                    timeout=3600  # 1 hour timeout
-                    )
-                    
-                    if result.returncode == 0:
-                        # Success - update executable path
-                        rar2fs_exe = r"C:\Program Files\rar2fs\rar2fs.bat"
-                        self.rar2fs_exe_var.set(rar2fs_exe)
-                        
-                        self.rar2fs_status_label.config(text="✅ rar2fs: Installation completed", foreground='green')
-                        
-                        # Test installation
-                        self.test_rar2fs()
-                        
-                        messagebox.showinfo(
-                            "Installation Complete", 
-                            "rar2fs has been installed successfully!\n\n"
-                            "Components installed:\n"
-                            "• WinFSP (Windows File System Proxy)\n"
-                            "• Cygwin with development tools\n"
-                            "• UnRAR library\n"
-                            "• rar2fs v1.29.7 compiled from source\n"
-                            "• Windows wrapper for easy usage\n\n"
-                            f"rar2fs is available at:\n{rar2fs_exe}\n\n"
-                            "You can now use rar2fs processing mode!"
-                        )
-                    else:
-                        self.rar2fs_status_label.config(text="❌ rar2fs: Installation failed", foreground='red')
-                        messagebox.showerror(
-                            "Installation Failed", 
-                            f"rar2fs installation failed.\n\n"
-                            f"Error output:\n{result.stderr[:500]}\n\n"
-                            "Please check the installation logs for details."
-                        )
-                        
-                except subprocess.TimeoutExpired:
-                    self.rar2fs_status_label.config(text="❌ rar2fs: Installation timeout", foreground='red')
-                    messagebox.showerror("Installation Timeout", "Installation took too long and was cancelled.")
-                except Exception as e:
-                    self.rar2fs_status_label.config(text=f"❌ rar2fs: Installation error", foreground='red')
-                    messagebox.showerror("Installation Error", f"Failed to run installer:\n\n{e}")
-                    
-            except FileNotFoundError:
-                self.rar2fs_status_label.config(text="❌ Enhanced installer not found", foreground='red')
-                messagebox.showerror(
-                    "Installer Error", 
-                    "Enhanced rar2fs installer not found.\n\n"
-                    "Please ensure advanced_rar2fs_installer.py is available."
+                # Run the enhanced installer
+                result = subprocess.run([
+                    sys.executable, 
+                    installer_path
+                ], 
+                cwd=os.path.dirname(installer_path),
+                capture_output=True, 
+                text=True, 
+                timeout=3600  # 1 hour timeout
                 )
             except Exception as e:
-                self.rar2fs_status_label.config(text=f"❌ Installation error", foreground='red')
-                messagebox.showerror("Installation Error", f"An error occurred:\n\n{e}")
+                self.parent.after(0, self._on_rar2fs_install_error, e)
+                return
+            self.parent.after(0, self._on_rar2fs_installed, result)
         
-        # Run installation in thread
-        import threading
-        install_thread = threading.Thread(target=install_in_thread, daemon=True)
-        install_thread.start()
+        # Run installation on the install worker
+        self._install_future = self._install_executor.submit(install_in_thread)
     
-
+    def _on_rar2fs_installed(self, result):
+        """Report a finished rar2fs installer run"""
+        if result.returncode == 0:
+            # Success - update executable path
+            rar2fs_exe = r"C:\Program Files\rar2fs\rar2fs.bat"
+            self.rar2fs_exe_var.set(rar2fs_exe)
+            
+            self._schedule_status('rar2fs_status_label', "✅ rar2fs: Installation completed", 'green')
+            
+            # Test installation
+            self.test_rar2fs()
+            
+            messagebox.showinfo("Installation Complete", RAR2FS_INSTALL_OK_TEMPLATE.format(rar2fs_exe=rar2fs_exe))
+        else:
+            self._schedule_status('rar2fs_status_label', "❌ rar2fs: Installation failed", 'red')
+            messagebox.showerror("Installation Failed", RAR2FS_INSTALL_FAILED_TEMPLATE.format(stderr=result.stderr[:500]))
+    
+    def _on_rar2fs_install_error(self, error):
+        """Report a rar2fs installer run that could not complete"""
+        if isinstance(error, subprocess.TimeoutExpired):
+            self._schedule_status('rar2fs_status_label', "❌ rar2fs: Installation timeout", 'red')
+            messagebox.showerror("Installation Timeout", "Installation took too long and was cancelled.")
+        else:
+            self._schedule_status('rar2fs_status_label', "❌ rar2fs: Installation error", 'red')
+            messagebox.showerror("Installation Error", f"Failed to run installer:\n\n{error}")
     
     def browse_mount_base(self):
         """Browse for mount base directory"""
-        directory = filedialog.askdirectory(title="Select Mount Base Directory")
+        directory = filedialog.askdirectory(title="Select Mount Base Directory",
+                                            initialdir=_initial_dir(self.vfs_mount_base_var.get()))
         if directory:
             self.vfs_mount_base_var.set(directory)
     
     def browse_rar2fs_exe(self):
         """Browse for rar2fs executable"""
         filename = filedialog.askopenfilename(title="Select rar2fs Executable", 
+                                            initialdir=_initial_dir(os.path.dirname(self.rar2fs_exe_var.get())),
                                             filetypes=[("Executable files", "*.exe")])
         if filename:
             self.rar2fs_exe_var.set(filename)
     
     def browse_rar2fs_mount_base(self):
         """Browse for rar2fs mount base directory"""
-        directory = filedialog.askdirectory(title="Select rar2fs Mount Base Directory")
+        directory = filedialog.askdirectory(title="Select rar2fs Mount Base Directory",
+                                            initialdir=_initial_dir(self.rar2fs_mount_base_var.get()))
         if directory:
             self.rar2fs_mount_base_var.set(directory)
     
     def browse_work_dir(self):
         """Browse for work directory"""
-        directory = filedialog.askdirectory(title="Select Work Directory")
+        directory = filedialog.askdirectory(title="Select Work Directory",
+                                            initialdir=_initial_dir(self.extraction_work_var.get()))
         if directory:
             self.extraction_work_var.set(directory)
     
     def apply_and_restart(self):
         """Apply configuration and restart service"""
         try:
-            # Save configuration first
-            self.save_enhanced_setup_config()
+            # Save configuration first, restart once it is on disk
+            self.save_enhanced_setup_config(on_saved=self.restart_service)
             
-            # Restart service
+        except Exception as e:
+            self.setup_status_label.config(text=f"Error restarting service: {e}", foreground='red')
+            messagebox.showerror("Restart Error", f"Failed to restart service: {e}")
+    
+    def restart_service(self):
+        """Restart the service with the saved configuration"""
+        try:
             self.setup_status_label.config(text="Restarting service...", foreground='blue')
             # Implementation for service restart
             
@@ -1569,28 +2204,51 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             messagebox.showerror("Restart Error", f"Failed to restart service: {e}")
     
     def test_directory_pair(self):
-        """Test selected directory pair"""
+        """Test the selected directory pairs"""
         selected = self.pairs_tree.selection()
         if not selected:
             messagebox.showwarning("No Selection", "Please select a directory pair to test")
             return
         
-        # Get selected item data
-        item = self.pairs_tree.item(selected[0])
-        values = item['values']
-        
-        # Update status
-        self.pairs_tree.item(selected[0], values=(
-            values[0], values[1], values[2], values[3], 'Testing...'
-        ))
-        
-        # Test the pair
-        # Implementation for testing directory pair
-        
-        # Update status
-        self.pairs_tree.item(selected[0], values=(
-            values[0], values[1], values[2], values[3], 'OK'
-        ))
+        # Test the pairs side by side on the executor; each row shows its result as it finishes
+        for iid in selected:
+            pair = self._pair_by_iid.get(iid)
+            if pair is None:
+                continue
+            
+            # Update status
+            self.pairs_tree.set(iid, 'Status', 'Testing...')
+            
+            future = self._executor.submit(self._check_directory_pair, pair['source'], pair['target'])
+            future.add_done_callback(lambda f, iid=iid: self.parent.after(0, self._on_directory_pair_tested, f, iid))
+    
+    @staticmethod
+    def _check_directory_pair(source, target):
+        """Return the status text for a directory pair's source and target directories"""
+        if not os.path.isdir(source):
+            return 'Source missing'
+        if not os.access(source, os.R_OK):
+            return 'Source unreadable'
+        
+        # The target may be created on first use, so its parent must exist instead
+        if os.path.isdir(target):
+            if not os.access(target, os.W_OK):
+                return 'Target not writable'
+        elif not os.path.isdir(os.path.dirname(os.path.abspath(target))):
+            return 'Target missing'
+        return 'OK'
+    
+    def _on_directory_pair_tested(self, future, iid):
+        """Show the result of a directory pair test in its row"""
+        # The row may have been removed while the test ran
+        if not self.pairs_tree.exists(iid):
+            return
+        try:
+            status = future.result()
+        except Exception as e:
+            logger.warning("Error testing directory pair: %s", e)
+            status = 'FAIL'
+        self.pairs_tree.set(iid, 'Status', status)
     
     def check_rar2fs_dependencies(self):
         """Check rar2fs dependencies (WinFSP, etc.)"""
@@ -1599,8 +2257,8 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             
             # Check WinFSP
             try:
-                result = subprocess.run(['sc', 'query', 'WinFsp'], 
-                                      capture_output=True, text=True)
+                result = subprocess.run(['sc', 'query', 'WinFsp'], stdin=subprocess.DEVNULL,
+                                      capture_output=True, text=True, creationflags=NO_WINDOW)
                 if result.returncode == 0:
                     dependencies_status.append("✅ WinFSP service: Running")
                 else:
@@ -1632,8 +2290,8 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
     def start_rar2fs_service(self):
         """Start rar2fs service"""
         try:
-            self.rar2fs_service_status_label.config(text="🔄 Starting rar2fs service...", foreground='blue')
-            self.parent.update()
+            self._set_status('rar2fs_service_status_label', "🔄 Starting rar2fs service...", 'blue')
+            self.parent.update_idletasks()
             
             # Import rar2fs handler if available
             try:
@@ -1643,7 +2301,7 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 config = {
                     'executable': self.rar2fs_exe_var.get(),
                     'mount_base': self.rar2fs_mount_base_var.get(),
-                    'mount_options': self.rar2fs_options_text.get('1.0', tk.END).strip().split('\n'),
+                    'mount_options': self._get_rar2fs_mount_options(),
                     'timeout': int(self.rar2fs_timeout_var.get())
                 }
                 
@@ -1651,11 +2309,11 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 
                 # Initialize handler
                 if handler.initialize():
-                    self.rar2fs_service_status_label.config(text="✅ rar2fs service: Started successfully", foreground='green')
+                    self._set_status('rar2fs_service_status_label', "✅ rar2fs service: Started successfully", 'green')
                     messagebox.showinfo("Service Started", "rar2fs service started successfully!")
                     self.refresh_rar2fs_status()
                 else:
-                    self.rar2fs_service_status_label.config(text="❌ rar2fs service: Failed to start", foreground='red')
+                    self._set_status('rar2fs_service_status_label', "❌ rar2fs service: Failed to start", 'red')
                     messagebox.showerror("Service Error", "Failed to start rar2fs service. Check configuration and dependencies.")
                     
             except ImportError:
@@ -1666,21 +2324,21 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                     mount_base = Path(self.rar2fs_mount_base_var.get())
                     mount_base.mkdir(parents=True, exist_ok=True)
                     
-                    self.rar2fs_service_status_label.config(text="✅ rar2fs ready for manual mounting", foreground='green')
+                    self._set_status('rar2fs_service_status_label', "✅ rar2fs ready for manual mounting", 'green')
                     messagebox.showinfo("Service Ready", "rar2fs is ready. Mount archives manually using the configured executable.")
                 else:
-                    self.rar2fs_service_status_label.config(text="❌ rar2fs executable not found", foreground='red')
+                    self._set_status('rar2fs_service_status_label', "❌ rar2fs executable not found", 'red')
                     messagebox.showerror("Service Error", "rar2fs executable not found. Please install rar2fs first.")
                     
         except Exception as e:
-            self.rar2fs_service_status_label.config(text=f"❌ rar2fs service: Error - {e}", foreground='red')
+            self._set_status('rar2fs_service_status_label', f"❌ rar2fs service: Error - {e}", 'red')
             messagebox.showerror("Service Error", f"Error starting rar2fs service: {e}")
     
     def stop_rar2fs_service(self):
         """Stop rar2fs service"""
         try:
-            self.rar2fs_service_status_label.config(text="🔄 Stopping rar2fs service...", foreground='blue')
-            self.parent.update()
+            self._set_status('rar2fs_service_status_label', "🔄 Stopping rar2fs service...", 'blue')
+            self.parent.update_idletasks()
             
             # Try to unmount all rar2fs mounts first
             self.unmount_all_rar2fs()
@@ -1699,28 +2357,28 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                 
                 # Cleanup/stop handler
                 if handler.cleanup():
-                    self.rar2fs_service_status_label.config(text="✅ rar2fs service: Stopped successfully", foreground='green')
+                    self._set_status('rar2fs_service_status_label', "✅ rar2fs service: Stopped successfully", 'green')
                     messagebox.showinfo("Service Stopped", "rar2fs service stopped and all mounts cleaned up.")
                 else:
-                    self.rar2fs_service_status_label.config(text="⚠️ rar2fs service: Stopped with warnings", foreground='orange')
+                    self._set_status('rar2fs_service_status_label', "⚠️ rar2fs service: Stopped with warnings", 'orange')
                     messagebox.showwarning("Service Stopped", "rar2fs service stopped, but some mounts may still be active.")
                     
             except ImportError:
                 # Fallback: basic cleanup
-                self.rar2fs_service_status_label.config(text="✅ rar2fs service: Stopped (manual mode)", foreground='green')
+                self._set_status('rar2fs_service_status_label', "✅ rar2fs service: Stopped (manual mode)", 'green')
                 messagebox.showinfo("Service Stopped", "rar2fs stopped. Any active mounts should be unmounted manually.")
             
             self.refresh_rar2fs_status()
             
         except Exception as e:
-            self.rar2fs_service_status_label.config(text=f"❌ rar2fs service: Error - {e}", foreground='red')
+            self._set_status('rar2fs_service_status_label', f"❌ rar2fs service: Error - {e}", 'red')
             messagebox.showerror("Service Error", f"Error stopping rar2fs service: {e}")
     
     def restart_rar2fs_service(self):
         """Restart rar2fs service"""
         try:
-            self.rar2fs_service_status_label.config(text="🔄 Restarting rar2fs service...", foreground='blue')
-            self.parent.update()
+            self._set_status('rar2fs_service_status_label', "🔄 Restarting rar2fs service...", 'blue')
+            self.parent.update_idletasks()
             
             # Stop first
             self.stop_rar2fs_service()
@@ -1729,14 +2387,19 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.parent.after(2000, self.start_rar2fs_service)  # Start after 2 seconds
             
         except Exception as e:
-            self.rar2fs_service_status_label.config(text=f"❌ rar2fs service: Restart failed - {e}", foreground='red')
+            self._set_status('rar2fs_service_status_label', f"❌ rar2fs service: Restart failed - {e}", 'red')
             messagebox.showerror("Service Error", f"Error restarting rar2fs service: {e}")
     
     def view_rar2fs_mounts(self):
         """View active rar2fs mounts"""
+        self._set_mounts_text(self._probe_rar2fs_mounts(self.rar2fs_mount_base_var.get()))
+    
+    @staticmethod
+    def _probe_rar2fs_mounts(mount_base):
+        """Describe the mount directories under mount_base; return the mounts display text"""
         try:
             mount_info = []
-            mount_base = Path(self.rar2fs_mount_base_var.get())
+            mount_base = Path(mount_base)
             
             if mount_base.exists():
                 # Check for mount directories
@@ -1756,17 +2419,10 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             if not mount_info:
                 mount_info = ["No active mounts found"]
             
-            # Update the mounts display
-            self.rar2fs_mounts_text.config(state=tk.NORMAL)
-            self.rar2fs_mounts_text.delete('1.0', tk.END)
-            self.rar2fs_mounts_text.insert(tk.END, '\n'.join(mount_info))
-            self.rar2fs_mounts_text.config(state=tk.DISABLED)
+            return '\n'.join(mount_info)
             
         except Exception as e:
-            self.rar2fs_mounts_text.config(state=tk.NORMAL)
-            self.rar2fs_mounts_text.delete('1.0', tk.END)
-            self.rar2fs_mounts_text.insert(tk.END, f"Error viewing mounts: {e}")
-            self.rar2fs_mounts_text.config(state=tk.DISABLED)
+            return f"Error viewing mounts: {e}"
     
     def open_mount_directory(self):
         """Open rar2fs mount directory in Explorer"""
@@ -1793,8 +2449,8 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
                     if mount_dir.is_dir():
                         try:
                             # Try to unmount using fusermount (if available)
-                            result = subprocess.run(['fusermount', '-u', str(mount_dir)], 
-                                                  capture_output=True, text=True, timeout=30)
+                            result = subprocess.run(['fusermount', '-u', str(mount_dir)], stdin=subprocess.DEVNULL,
+                                                  capture_output=True, text=True, timeout=30, creationflags=NO_WINDOW)
                             if result.returncode == 0:
                                 unmounted_count += 1
                             else:
@@ -1826,46 +2482,17 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
         except Exception as e:
             messagebox.showerror("Unmount Error", f"Error during unmount operation: {e}")
     
-    def silent_refresh_rar2fs_status(self):
-        """Silently refresh rar2fs status information without message boxes"""
+    @staticmethod
+    def _probe_winfsp_service():
+        """Check whether the WinFSP service is running; return (status text, color)"""
         try:
-            # Test rar2fs executable silently
-            rar2fs_exe = Path(self.rar2fs_exe_var.get())
-            
-            if not rar2fs_exe.exists():
-                self.rar2fs_status_label.config(text="❌ rar2fs: Executable not found", foreground='red')
-            else:
-                try:
-                    # Test executable silently
-                    result = subprocess.run([str(rar2fs_exe), '--help'], 
-                                          capture_output=True, text=True, timeout=10)
-                    
-                    if result.returncode == 0:
-                        self.rar2fs_status_label.config(text="✅ rar2fs: Configuration OK", foreground='green')
-                    else:
-                        self.rar2fs_status_label.config(text="❌ rar2fs: Executable test failed", foreground='red')
-                        
-                except Exception as e:
-                    self.rar2fs_status_label.config(text=f"❌ rar2fs: {e}", foreground='red')
-            
-            # Update mount view silently
-            self.view_rar2fs_mounts()
-            
-            # Check service status silently
-            try:
-                # Check if WinFSP service is running
-                result = subprocess.run(['sc', 'query', 'WinFsp'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0 and "RUNNING" in result.stdout:
-                    self.rar2fs_service_status_label.config(text="✅ WinFSP service: Running", foreground='green')
-                else:
-                    self.rar2fs_service_status_label.config(text="❌ WinFSP service: Not running", foreground='red')
-            except:
-                self.rar2fs_service_status_label.config(text="❓ WinFSP service: Status unknown", foreground='orange')
-            
-        except Exception as e:
-            # Silent error handling - just update status label
-            self.rar2fs_status_label.config(text=f"❌ rar2fs: Error - {e}", foreground='red')
+            result = subprocess.run(['sc', 'query', 'WinFsp'], stdin=subprocess.DEVNULL,
+                                  capture_output=True, text=True, creationflags=NO_WINDOW)
+            if result.returncode == 0 and "RUNNING" in result.stdout:
+                return "✅ WinFSP service: Running", 'green'
+            return "❌ WinFSP service: Not running", 'red'
+        except Exception:
+            return "❓ WinFSP service: Status unknown", 'orange'
     
     def refresh_rar2fs_status(self):
         """Refresh all rar2fs status information"""
@@ -1877,16 +2504,7 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
             self.view_rar2fs_mounts()
             
             # Check service status
-            try:
-                # Check if WinFSP service is running
-                result = subprocess.run(['sc', 'query', 'WinFsp'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0 and "RUNNING" in result.stdout:
-                    self.rar2fs_service_status_label.config(text="✅ WinFSP service: Running", foreground='green')
-                else:
-                    self.rar2fs_service_status_label.config(text="❌ WinFSP service: Not running", foreground='red')
-            except:
-                self.rar2fs_service_status_label.config(text="❓ WinFSP service: Status unknown", foreground='orange')
+            self._set_status('rar2fs_service_status_label', *self._probe_winfsp_service())
             
             messagebox.showinfo("Status Refresh", "rar2fs status information refreshed!")
             
@@ -1949,123 +2567,101 @@ Note: Enhanced UPnP discovery with multiple methods attempted."""
 class DirectoryPairDialog:
     """Dialog for adding/editing directory pairs with processing mode selection"""
     
-    def __init__(self, parent, processing_modes, plex_libraries, existing_pair=None):
+    def __init__(self, parent, processing_modes, library_titles, existing_pair=None):
         self.parent = parent
         self.processing_modes = processing_modes
-        self.plex_libraries = plex_libraries
+        self.library_titles = library_titles
         self.existing_pair = existing_pair
         self.result = None
         
-        # Create dialog window
+        # Create dialog window, centered; its content is built on show()
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Directory Pair Configuration")
-        self.dialog.geometry("600x500")
+        self.dialog.geometry(_centered_geometry(parent, 600, 500))
         self.dialog.transient(parent)
         self.dialog.grab_set()
-        
-        self.create_dialog_content()
-        
-        # Center dialog
-        self.dialog.geometry("600x500+300+200")
+        self._built = False
     
     def create_dialog_content(self):
         """Create dialog content"""
-        # Main frame
+        # Main frame; rows are gridded in one column of fields plus a column of Browse buttons
         main_frame = ttk.Frame(self.dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
+        main_frame.columnconfigure(0, weight=1)
         
         # Source directory
-        ttk.Label(main_frame, text="Source Directory (where RAR files are placed):").pack(anchor=tk.W, pady=(0, 5))
-        source_frame = ttk.Frame(main_frame)
-        source_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(main_frame, text="Source Directory (where RAR files are placed):").grid(row=0, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         self.source_var = tk.StringVar(value=self.existing_pair['source'] if self.existing_pair else '')
-        ttk.Entry(source_frame, textvariable=self.source_var, width=60).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(source_frame, text="Browse", command=self.browse_source).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Entry(main_frame, textvariable=self.source_var, width=60).grid(row=1, column=0, sticky=tk.EW, pady=(0, 10))
+        ttk.Button(main_frame, text="Browse", command=self.browse_source).grid(row=1, column=1, padx=(5, 0), pady=(0, 10))
         
         # Target directory
-        ttk.Label(main_frame, text="Target Directory (where extracted files go):").pack(anchor=tk.W, pady=(0, 5))
-        target_frame = ttk.Frame(main_frame)
-        target_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(main_frame, text="Target Directory (where extracted files go):").grid(row=2, column=0, columnspan=2, sticky=tk.W, pady=(0, 5))
         
         self.target_var = tk.StringVar(value=self.existing_pair['target'] if self.existing_pair else '')
-        ttk.Entry(target_frame, textvariable=self.target_var, width=60).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        ttk.Button(target_frame, text="Browse", command=self.browse_target).pack(side=tk.RIGHT, padx=(5, 0))
+        ttk.Entry(main_frame, textvariable=self.target_var, width=60).grid(row=3, column=0, sticky=tk.EW, pady=(0, 10))
+        ttk.Button(main_frame, text="Browse", command=self.browse_target).grid(row=3, column=1, padx=(5, 0), pady=(0, 10))
         
         # Processing mode selection
-        ttk.Label(main_frame, text="Processing Mode:").pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(main_frame, text="Processing Mode:").grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
         
         self.processing_mode_var = tk.StringVar(value=self.existing_pair['processing_mode'] if self.existing_pair else 'python_vfs')
         
-        for mode_id, mode_info in self.processing_modes.items():
-            mode_frame = ttk.Frame(main_frame)
-            mode_frame.pack(fill=tk.X, pady=2)
-            
-            ttk.Radiobutton(
-                mode_frame,
-                text=mode_info['name'],
-                variable=self.processing_mode_var,
-                value=mode_id
-            ).pack(side=tk.LEFT)
-            
-            # Description
-            desc_label = tk.Label(mode_frame, text=f"- {mode_info['description']}", foreground='gray')
-            desc_label.pack(side=tk.LEFT, padx=(10, 0))
+        _build_mode_tree(main_frame, self.processing_modes, self.processing_mode_var,
+                         ('description',)).grid(row=5, column=0, columnspan=2, sticky=tk.EW, pady=2)
         
         # Plex library selection
-        ttk.Label(main_frame, text="Plex Library:").pack(anchor=tk.W, pady=(10, 5))
+        ttk.Label(main_frame, text="Plex Library:").grid(row=6, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
         
         self.plex_library_var = tk.StringVar(value=self.existing_pair['plex_library'] if self.existing_pair else '')
         library_combo = ttk.Combobox(main_frame, textvariable=self.plex_library_var, width=50)
+        library_combo['values'] = self.library_titles or ('No libraries available',)
         
-        # Safely populate library values
-        try:
-            if self.plex_libraries:
-                library_values = []
-                for lib in self.plex_libraries:
-                    # Support both 'title' and 'name' fields for compatibility
-                    title = lib.get('title', lib.get('name', 'Unknown Library'))
-                    library_values.append(title)
-                library_combo['values'] = library_values
-            else:
-                library_combo['values'] = ['No libraries available']
-        except Exception as e:
-            print(f"Error populating library combo: {e}")
-            library_combo['values'] = ['Error loading libraries']
-        
-        library_combo.pack(anchor=tk.W, pady=(0, 10))
+        library_combo.grid(row=7, column=0, columnspan=2, sticky=tk.W, pady=(0, 10))
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(20, 0))
+        button_frame.grid(row=8, column=0, columnspan=2, sticky=tk.E, pady=(20, 0))
         
-        ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.RIGHT, padx=(5, 0))
-        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).grid(row=0, column=0)
+        self.ok_button = ttk.Button(button_frame, text="OK", command=self.ok_clicked)
+        self.ok_button.grid(row=0, column=1, padx=(5, 0))
+        
+        # OK is only enabled while both directories are filled in
+        self.source_var.trace_add('write', self._revalidate)
+        self.target_var.trace_add('write', self._revalidate)
+        self._revalidate()
+    
+    def _revalidate(self, *args):
+        """Cache the trimmed directories and enable OK when both are set"""
+        self._source = self.source_var.get().strip()
+        self._target = self.target_var.get().strip()
+        self._ok_ready = bool(self._source and self._target)
+        self.ok_button.state(['!disabled'] if self._ok_ready else ['disabled'])
     
     def browse_source(self):
         """Browse for source directory"""
-        directory = filedialog.askdirectory(title="Select Source Directory")
+        directory = filedialog.askdirectory(title="Select Source Directory",
+                                            initialdir=_initial_dir(self.source_var.get()))
         if directory:
             self.source_var.set(directory)
     
     def browse_target(self):
         """Browse for target directory"""
-        directory = filedialog.askdirectory(title="Select Target Directory")
+        directory = filedialog.askdirectory(title="Select Target Directory",
+                                            initialdir=_initial_dir(self.target_var.get(), self.source_var.get()))
         if directory:
             self.target_var.set(directory)
     
     def ok_clicked(self):
         """OK button clicked"""
-        source = self.source_var.get().strip()
-        target = self.target_var.get().strip()
-        
-        if not source or not target:
-            messagebox.showerror("Error", "Please specify both source and target directories")
+        if not self._ok_ready:
             return
         
         self.result = {
-            'source': source,
-            'target': target,
+            'source': self._source,
+            'target': self._target,
             'processing_mode': self.processing_mode_var.get(),
             'plex_library': self.plex_library_var.get(),
             'enabled': True
@@ -2079,6 +2675,9 @@ class DirectoryPairDialog:
     
     def show(self):
         """Show dialog and return result"""
+        if not self._built:
+            self.create_dialog_content()
+            self._built = True
         self.dialog.wait_window()
         return self.result
 
@@ -2092,17 +2691,13 @@ class ProcessingModeConfigDialog:
         self.processing_modes = processing_modes
         self.result = None
         
-        # Create dialog window
+        # Create dialog window, centered; its content is built on show()
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Processing Mode Configuration")
-        self.dialog.geometry("500x400")
+        self.dialog.geometry(_centered_geometry(parent, 500, 400))
         self.dialog.transient(parent)
         self.dialog.grab_set()
-        
-        self.create_dialog_content()
-        
-        # Center dialog
-        self.dialog.geometry("500x400+350+250")
+        self._built = False
     
     def create_dialog_content(self):
         """Create dialog content"""
@@ -2110,36 +2705,53 @@ class ProcessingModeConfigDialog:
         main_frame = ttk.Frame(self.dialog, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
         
+        main_frame.columnconfigure(0, weight=1)
+        
         # Mode selection
-        ttk.Label(main_frame, text="Select Processing Mode:", font=('TkDefaultFont', 12, 'bold')).pack(anchor=tk.W, pady=(0, 10))
+        ttk.Label(main_frame, text="Select Processing Mode:", style='Title.TLabel').grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
         
         self.mode_var = tk.StringVar(value=self.current_mode)
         
-        for mode_id, mode_info in self.processing_modes.items():
-            mode_frame = ttk.Frame(main_frame)
-            mode_frame.pack(fill=tk.X, pady=5)
-            
-            ttk.Radiobutton(
-                mode_frame,
-                text=mode_info['name'],
-                variable=self.mode_var,
-                value=mode_id
-            ).pack(side=tk.LEFT)
-            
-            # Details
-            details_frame = ttk.Frame(mode_frame)
-            details_frame.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(20, 0))
-            
-            tk.Label(details_frame, text=mode_info['description'], foreground='gray').pack(anchor=tk.W)
-            tk.Label(details_frame, text=f"Dependencies: {mode_info['dependencies']}", foreground='blue').pack(anchor=tk.W)
-            tk.Label(details_frame, text=f"Complexity: {mode_info['complexity']}", foreground='orange').pack(anchor=tk.W)
+        # One read-only combobox of mode names, with the selected mode's details below it
+        self.mode_ids = tuple(self.processing_modes)
+        self.mode_combo = ttk.Combobox(
+            main_frame,
+            values=tuple(mode_info['name'] for mode_info in self.processing_modes.values()),
+            state='readonly',
+            width=40
+        )
+        self.mode_combo.grid(row=1, column=0, sticky=tk.W, pady=5)
+        if self.current_mode in self.processing_modes:
+            self.mode_combo.current(self.mode_ids.index(self.current_mode))
+        self.mode_combo.bind('<<ComboboxSelected>>', self.on_mode_selected)
+        
+        self.mode_details_label = ttk.Label(main_frame, justify=tk.LEFT, style='Muted.TLabel')
+        self.mode_details_label.grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.update_mode_details()
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(20, 0))
+        button_frame.grid(row=3, column=0, sticky=tk.E, pady=(20, 0))
         
-        ttk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.RIGHT, padx=(5, 0))
-        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel_clicked).grid(row=0, column=0)
+        ttk.Button(button_frame, text="OK", command=self.ok_clicked).grid(row=0, column=1, padx=(5, 0))
+    
+    def on_mode_selected(self, event=None):
+        """Store the mode picked in the combobox"""
+        self.mode_var.set(self.mode_ids[self.mode_combo.current()])
+        self.update_mode_details()
+    
+    def update_mode_details(self):
+        """Show the description, dependencies and complexity of the selected mode"""
+        mode_info = self.processing_modes.get(self.mode_var.get())
+        if mode_info is None:
+            self.mode_details_label.config(text='')
+            return
+        self.mode_details_label.config(
+            text=f"{mode_info['description']}\n"
+                 f"Dependencies: {mode_info['dependencies']}\n"
+                 f"Complexity: {mode_info['complexity']}"
+        )
     
     def ok_clicked(self):
         """OK button clicked"""
@@ -2152,5 +2764,8 @@ class ProcessingModeConfigDialog:
     
     def show(self):
         """Show dialog and return result"""
+        if not self._built:
+            self.create_dialog_content()
+            self._built = True
         self.dialog.wait_window()
         return self.result 
\ No newline at end of file